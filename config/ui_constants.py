@@ -0,0 +1,99 @@
+# Static Dashboard Lookup Tables
+# dashboard.py exec()s dashboard_impl.py on every Streamlit rerun, so constant
+# tables defined there are rebuilt each time. Importing them from here means
+# they are built once per process.
+
+from config.trading_config import TRADING_CONFIG
+
+# Wallet chain id -> native asset symbol (used for USD valuation on sync)
+CHAIN_NATIVE_SYMBOLS = {
+    'bitcoin': 'BTC',
+    'litecoin': 'LTC',
+    'dogecoin': 'DOGE',
+    'tron': 'TRX',
+    'solana': 'SOL',
+    'cosmos': 'ATOM',
+    'ton': 'TON',
+    '1': 'ETH',
+    'ethereum': 'ETH',
+    '56': 'BNB',
+    '137': 'MATIC',
+    '43114': 'AVAX',
+    '250': 'FTM',
+    '10': 'OP',
+    '42161': 'ETH'
+}
+
+# Approximate prices used only when a live ticker is unavailable
+FALLBACK_USD_PRICES = {
+    'BTC': 95000.0, 'ETH': 2700.0, 'SOL': 150.0, 'BNB': 600.0,
+    'TON': 5.5, 'TRX': 0.16, 'LTC': 70.0, 'DOGE': 0.12, 'ATOM': 6.0,
+    'MATIC': 0.40, 'AVAX': 25.0, 'FTM': 0.60, 'OP': 1.50
+}
+
+# Manual Trading web3 balance estimate: chain id -> native USD price (unlisted chains count 1.0).
+# The mode-switch estimate never priced BSC; the continuous sync does.
+WEB3_SWITCH_USD_PRICES = {
+    'ton': 5.40, 'ton-mainnet': 5.40,
+    'solana': 145.20, 'solana-mainnet': 145.20,
+    '1': 2600.0, 'ethereum': 2600.0
+}
+WEB3_SYNC_USD_PRICES = {**WEB3_SWITCH_USD_PRICES, '56': 600.0, 'bsc': 600.0}
+
+# Web3 connect grid: one tuple per column of (button label, connect_modal value)
+WALLET_GRID_COLUMNS = (
+    (
+        ("🦊 MetaMask", "MetaMask"),
+        ("🔵 Coinbase", "Coinbase"),
+        ("👻 Phantom (SOL)", "Phantom"),
+        ("💎 TON Wallet", "TON Wallet"),
+        ("🔴 TronLink (TRX)", "TronLink (TRX)"),
+        ("🔗 WalletConnect", "WalletConnect"),
+    ),
+    (
+        ("🛡️ Trust Wallet", "Trust Wallet"),
+        ("⚫ OKX Wallet", "OKX Wallet"),
+        ("🪐 Keplr (Cosmos)", "Keplr"),
+        ("🌐 Browser Wallet", "Browser Wallet"),
+        ("🔒 Hardware (Ledger)", "Hardware Wallet"),
+    ),
+)
+
+# Wallet name substring -> default chain id for the connect form (first match wins, else '1')
+WALLET_DEFAULT_CHAINS = (
+    ('Phantom', 'solana'),
+    ('TON', 'ton'),
+    ('Keplr', 'cosmos'),
+    ('Trust', '56'),  # BNB
+    ('Bitcoin', 'bitcoin'),
+    ('Litecoin', 'litecoin'),
+    ('Dogecoin', 'dogecoin'),
+    ('Tron', 'tron'),
+)
+
+# Exchange id -> deposit page opened from Wallet & Execution > Add Funds
+EXCHANGE_DEPOSIT_URLS = {
+    'binance': 'https://www.binance.com/en/my/wallet/account/main/deposit',
+    'coinbase': 'https://www.coinbase.com/',
+}
+
+# Exchanges offered in the exchange pickers and API-key forms
+SUPPORTED_EXCHANGES = ('binance', 'coinbase', 'kraken', 'kucoin', 'bybit', 'okx')
+
+# System Targets page label, e.g. "70% - 90%"
+TARGET_APR_LABEL = "{:.0f}% - {:.0f}%".format(
+    TRADING_CONFIG['objectives']['target_apr_min'] * 100,
+    TRADING_CONFIG['objectives']['target_apr_max'] * 100
+)
+
+# Dashboard timeframe -> TradingView embed interval
+TV_INTERVAL_MAP = {
+    '30s': '1', '1m': '1', '3m': '3', '5m': '5', '15m': '15', '30m': '30',
+    '1h': '60', '2h': '120', '4h': '240', '6h': '360', '12h': '720', '1d': 'D'
+}
+
+# Chain id -> label for the Import New Wallet network picker (insertion order is display order)
+IMPORT_WALLET_NETWORKS = {
+    '1': 'Ethereum', '56': 'BNB Chain', '137': 'Polygon',
+    'solana': 'Solana', 'ton': 'TON', 'bitcoin': 'Bitcoin'
+}
@@ -67,22 +67,32 @@ class ArbitrageScanner:
                     prices[name] = price
         return prices
 
-    def scan_opportunities(self, symbol: str) -> List[Dict]:
+    def fetch_prices(self, symbol: str) -> Dict[str, float]:
+        """
+        One price snapshot across all monitored exchanges; pass it to
+        get_prices_df()/scan_opportunities() to avoid fetching twice.
+        """
+        return self._fetch_all_prices(symbol)
+
+    def scan_opportunities(self, symbol: str, prices: Optional[Dict[str, float]] = None) -> List[Dict]:
         """
         Scan for arbitrage opportunities across monitored exchanges.
         Fetches real prices where possible.
         """
-        prices = self._fetch_all_prices(symbol)
+        if prices is None:
+            prices = self._fetch_all_prices(symbol)
         
         if not prices or len(prices) < 2:
             return []
 
-        # Find min and max
-        min_ex = min(prices, key=prices.get)
-        max_ex = max(prices, key=prices.get)
+        # Find min and max in one array pass
+        names = list(prices)
+        px = np.fromiter(prices.values(), dtype=np.float64, count=len(names))
+        lo, hi = int(px.argmin()), int(px.argmax())
+        min_ex, max_ex = names[lo], names[hi]
         
-        min_price = prices[min_ex]
-        max_price = prices[max_ex]
+        min_price = float(px[lo])
+        max_price = float(px[hi])
         
         spread_pct = (max_price - min_price) / min_price * 100
         
@@ -117,22 +127,27 @@ class ArbitrageScanner:
                         
         return opportunities
         
-    def get_prices_df(self, symbol: str) -> pd.DataFrame:
+    def get_prices_df(self, symbol: str, prices: Optional[Dict[str, float]] = None) -> pd.DataFrame:
         """
         Returns a DataFrame of prices for display.
         """
-        prices = self._fetch_all_prices(symbol)
-        data = []
+        if prices is None:
+            prices = self._fetch_all_prices(symbol)
+        if not prices:
+            return pd.DataFrame()
         
-        for name, price in prices.items():
-            data.append({'Exchange': name.upper(), 'Price': price, 'Symbol': symbol})
-                
-        df = pd.DataFrame(data)
-        if not df.empty:
-            df = df.sort_values(by='Price', ascending=False)
-            min_price = df['Price'].min()
-            df['Spread (%)'] = ((df['Price'] - min_price) / min_price) * 100
-        return df
+        # Sort descending once; the minimum is then the last element
+        names = list(prices)
+        px = np.fromiter(prices.values(), dtype=np.float64, count=len(names))
+        order = np.argsort(px)[::-1]
+        px = px[order]
+        min_price = px[-1]
+        return pd.DataFrame({
+            'Exchange': [names[i].upper() for i in order],
+            'Price': px,
+            'Symbol': symbol,
+            'Spread (%)': (px - min_price) / min_price * 100
+        })
 
     def scan_quantum_opportunities(self, symbol: str) -> List[Dict]:
         """
@@ -176,6 +176,7 @@ class AuthManager:
         self.data_dir = data_dir
         self.users_file = os.path.join(self.data_dir, "users_db.json")
         self.security = SecurityManager() # Initialize Security Manager
+        self._decrypted_keys = {} # (username, exchange) -> (encrypted entry, decrypted dict)
         
         # Firestore Setup
         self.db_firestore = None
@@ -440,6 +441,10 @@ class AuthManager:
             if 'api_keys' not in self.users[username]:
                 self.users[username]['api_keys'] = {}
             
+            # Canonicalize once at input time (pasted keys often carry spaces/newlines)
+            api_key = "".join(str(api_key).split())
+            api_secret = "".join(str(api_secret).split())
+            
             # Encrypt sensitive data
             enc_key = self.security.encrypt_sensitive_data(api_key)
             enc_secret = self.security.encrypt_sensitive_data(api_secret)
@@ -450,7 +455,7 @@ class AuthManager:
             }
             
             if encryption_key:
-                data['encryption_key'] = self.security.encrypt_sensitive_data(encryption_key)
+                data['encryption_key'] = self.security.encrypt_sensitive_data("".join(str(encryption_key).split()))
 
             self.users[username]['api_keys'][exchange] = data
             self._save_users()
@@ -462,6 +467,11 @@ class AuthManager:
         if username in self.users:
             keys = self.users[username].get('api_keys', {}).get(exchange)
             if keys:
+                # Reuse the last decryption while the stored ciphertext is unchanged
+                cached = self._decrypted_keys.get((username, exchange))
+                if cached and cached[0] == keys:
+                    return dict(cached[1])
+                
                 # Decrypt sensitive data
                 dec_keys = {}
                 if 'api_key' in keys:
@@ -471,14 +481,20 @@ class AuthManager:
                 if 'encryption_key' in keys:
                     dec_keys['encryption_key'] = self.security.decrypt_sensitive_data(keys['encryption_key'])
                 
-                return dec_keys
+                self._decrypted_keys[(username, exchange)] = (dict(keys), dec_keys)
+                return dict(dec_keys)
         return None
 
+    def has_api_keys(self, username, exchange):
+        """Check whether keys are stored for an exchange without decrypting them"""
+        return bool(self.users.get(username, {}).get('api_keys', {}).get(exchange))
+
     def delete_api_keys(self, username, exchange):
         """Remove API keys for a user and exchange"""
         if username in self.users and 'api_keys' in self.users[username]:
             if exchange in self.users[username]['api_keys']:
                 del self.users[username]['api_keys'][exchange]
+                self._decrypted_keys.pop((username, exchange), None)
                 self._save_users()
                 return True
         return False
@@ -548,6 +564,7 @@ class UserManager:
         self.wallet_file = os.path.join(self.user_dir, "paper_wallet.json")
         self.history_file = os.path.join(self.user_dir, "trade_history.json")
         self.positions_file = os.path.join(self.user_dir, "positions.json")
+        self._metrics_cache = None # (history file signature, metrics)
         self._ensure_files()
 
     def _ensure_files(self):
@@ -681,9 +698,28 @@ class UserManager:
         except:
             return []
 
+    def _history_signature(self):
+        try:
+            st = os.stat(self.history_file)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
     def get_performance_metrics(self):
+        """Performance metrics, recomputed only when the trade history file changes"""
+        sig = self._history_signature()
+        if sig is not None and self._metrics_cache and self._metrics_cache[0] == sig:
+            return dict(self._metrics_cache[1])
+        metrics = self._compute_performance_metrics()
+        self._metrics_cache = (sig, metrics) if sig is not None else None
+        return dict(metrics)
+
+    def _compute_performance_metrics(self):
+        import numpy as np
         history = self.get_trade_history()
-        if not history:
+        # Closed-trade PnL as one float array; every metric below is a vectorized reduction over it
+        pnl = np.fromiter((t['pnl'] for t in history if t['side'].lower() == 'sell'), dtype=np.float64)
+        if pnl.size == 0:
             return {
                 "total_pnl": 0.0,
                 "win_rate": 0.0,
@@ -693,49 +729,25 @@ class UserManager:
                 "max_drawdown": 0.0
             }
             
-        closed_trades = [t for t in history if t['side'].lower() == 'sell']
-        if not closed_trades:
-             return {
-                "total_pnl": 0.0,
-                "win_rate": 0.0,
-                "total_trades": 0,
-                "profit_factor": 0.0,
-                "sharpe_ratio": 0.0,
-                "max_drawdown": 0.0
-            }
-            
-        total_pnl = sum(t['pnl'] for t in closed_trades)
-        wins = [t for t in closed_trades if t['pnl'] > 0]
-        losses = [t for t in closed_trades if t['pnl'] <= 0]
+        wins = pnl > 0
+        win_rate = float(wins.mean()) * 100
         
-        win_rate = (len(wins) / len(closed_trades)) * 100 if closed_trades else 0.0
-        
-        gross_profit = sum(t['pnl'] for t in wins)
-        gross_loss = abs(sum(t['pnl'] for t in losses))
+        gross_profit = float(pnl[wins].sum())
+        gross_loss = abs(float(pnl[~wins].sum()))
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else 999.0
 
-        # Advanced Metrics
-        pnl_series = [t['pnl'] for t in closed_trades]
-        
         # Sharpe Ratio (Simplified assuming risk-free rate = 0)
-        import numpy as np
-        if len(pnl_series) > 1:
-            mean_pnl = np.mean(pnl_series)
-            std_pnl = np.std(pnl_series)
-            sharpe = mean_pnl / std_pnl if std_pnl > 0 else 0.0
-        else:
-            sharpe = 0.0
+        std_pnl = float(pnl.std()) if pnl.size > 1 else 0.0
+        sharpe = float(pnl.mean()) / std_pnl if std_pnl > 0 else 0.0
 
         # Max Drawdown
-        cumulative = np.cumsum(pnl_series)
-        peak = np.maximum.accumulate(cumulative)
-        drawdown = peak - cumulative
-        max_dd = np.max(drawdown) if len(drawdown) > 0 else 0.0
+        cumulative = np.cumsum(pnl)
+        max_dd = float((np.maximum.accumulate(cumulative) - cumulative).max())
         
         return {
-            "total_pnl": total_pnl,
+            "total_pnl": float(cumulative[-1]),
             "win_rate": win_rate,
-            "total_trades": len(closed_trades),
+            "total_trades": int(pnl.size),
             "profit_factor": profit_factor,
             "sharpe_ratio": sharpe,
             "max_drawdown": max_dd
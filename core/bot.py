@@ -4,6 +4,7 @@ import time
 import core.dns_fix
 from datetime import datetime
 import pandas as pd
+import numpy as np
 from core.data import DataManager
 from core.models import Signal
 from core.risk import AdaptiveRiskManager
@@ -19,6 +20,30 @@ from core.fiat.fiat_manager import FiatManager
 import json
 import os
 import importlib
+import itertools
+
+# Process-wide so a fresh bot (or a reused list id) never repeats an older wallet_balances version
+_wallet_balances_versions = itertools.count(1)
+
+DEBUG_WALLET_LOG = "debug_wallet_log.txt"
+DEBUG_WALLET_LOG_MAX_BYTES = 256 * 1024
+DEBUG_WALLET_LOG_KEEP_BYTES = 64 * 1024
+
+def _append_debug_wallet_log(text):
+    """Append to the wallet-sync debug log, trimming it to its tail once it passes the size cap"""
+    try:
+        with open(DEBUG_WALLET_LOG, "a", encoding='utf-8') as f:
+            f.write(text)
+            size = f.tell()
+        if size > DEBUG_WALLET_LOG_MAX_BYTES:
+            with open(DEBUG_WALLET_LOG, "rb") as f:
+                f.seek(-DEBUG_WALLET_LOG_KEEP_BYTES, os.SEEK_END)
+                tail = f.read()
+            # Start on a line boundary
+            with open(DEBUG_WALLET_LOG, "wb") as f:
+                f.write(tail[tail.find(b"\n") + 1:])
+    except OSError:
+        pass
 
 class TradingBot:
     def __init__(self, exchange_id='binance'):
@@ -521,6 +546,53 @@ class TradingBot:
             print(f"❌ Invalid Mode: {mode}")
             return False
 
+    WALLET_NUMERIC_FIELDS = ('total', 'free', 'locked', 'value_usd')
+
+    @property
+    def wallet_balances(self):
+        return self._wallet_balances
+
+    @wallet_balances.setter
+    def wallet_balances(self, balances):
+        self._wallet_balances = balances
+        self._wallet_balances_version = next(_wallet_balances_versions)
+
+    def wallet_balances_sig(self):
+        """
+        Invalidation key for anything derived from wallet_balances: changes on every
+        reassignment (sync_live_balance() starts a new list) and on every append.
+        """
+        return (self._wallet_balances_version, len(self._wallet_balances))
+
+    def wallet_balance_columns(self):
+        """
+        Column-oriented view of wallet_balances: one numpy array per key, in first-seen
+        key order (the layout pd.DataFrame(wallet_balances) gives). Numeric fields are
+        float64 with NaN where a row lacks them; every other key is an object column.
+        Rebuilt only when wallet_balances_sig() changes.
+        """
+        wb = self.wallet_balances
+        sig = self.wallet_balances_sig()
+        cached = getattr(self, '_wallet_columns', None)
+        if cached and cached[0] == sig:
+            return cached[1]
+
+        n = len(wb)
+        cols = {}
+        for key in dict.fromkeys(k for r in wb for k in r):
+            if key in self.WALLET_NUMERIC_FIELDS:
+                cols[key] = np.fromiter(
+                    (np.nan if r.get(key) is None else float(r[key]) for r in wb),
+                    dtype=np.float64, count=n
+                )
+            else:
+                col = np.empty(n, dtype=object)  # filled per item so list/dict values stay scalars
+                for i, r in enumerate(wb):
+                    col[i] = r.get(key)
+                cols[key] = col
+        self._wallet_columns = (sig, cols)
+        return cols
+
     def sync_live_balance(self):
         """Fetch real balance from exchange/chain and update risk manager"""
         # Ensure wallet_balances exists and is reset
@@ -806,8 +878,7 @@ class TradingBot:
                                     'value_usd': round(usd_val, 2)
                                 })
                         except Exception as e:
-                             with open("debug_wallet_log.txt", "a", encoding='utf-8') as f:
-                                f.write(f"ERROR parsing asset {currency}: {e}\n")
+                             _append_debug_wallet_log(f"ERROR parsing asset {currency}: {e}\n")
 
                 # Method B: Iterate over 'free' dict if 'total' missed some or didn't exist
                 if 'free' in balance:
@@ -846,8 +917,7 @@ class TradingBot:
                                     'value_usd': round(usd_val, 2)
                                 })
                         except Exception as e:
-                             with open("debug_wallet_log.txt", "a", encoding='utf-8') as f:
-                                f.write(f"ERROR parsing free asset {currency}: {e}\n")
+                             _append_debug_wallet_log(f"ERROR parsing free asset {currency}: {e}\n")
 
 
                 # Method C: Iterate over root keys (for assets that act as objects, e.g. balance['BTC'] = {'free':...})
@@ -893,14 +963,14 @@ class TradingBot:
                             pass
                 
                 # Log Found Assets to Debug File
-                with open("debug_wallet_log.txt", "a", encoding='utf-8') as f:
-                    f.write(f"\n--- Extracted Assets ({len(self.wallet_balances)}) ---\n")
-                    # Log first 20 and last 20 if too many
-                    log_items = self.wallet_balances if len(self.wallet_balances) < 50 else self.wallet_balances[:20] + self.wallet_balances[-20:]
-                    for item in log_items:
-                        f.write(f"{item['asset']}: {item['total']} (Free: {item['free']}, Locked: {item['locked']})\n")
-                    if len(self.wallet_balances) >= 50:
-                        f.write(f"... and {len(self.wallet_balances) - 40} more ...\n")
+                log_lines = [f"\n--- Extracted Assets ({len(self.wallet_balances)}) ---\n"]
+                # Log first 20 and last 20 if too many
+                log_items = self.wallet_balances if len(self.wallet_balances) < 50 else self.wallet_balances[:20] + self.wallet_balances[-20:]
+                for item in log_items:
+                    log_lines.append(f"{item['asset']}: {item['total']} (Free: {item['free']}, Locked: {item['locked']})\n")
+                if len(self.wallet_balances) >= 50:
+                    log_lines.append(f"... and {len(self.wallet_balances) - 40} more ...\n")
+                _append_debug_wallet_log("".join(log_lines))
 
                 # Fallback for Bybit V5 Unified if CCXT 'total' is empty/incomplete
                 if not self.wallet_balances and self.data_manager.exchange_id == 'bybit':
@@ -974,8 +1044,7 @@ class TradingBot:
                 # 3. Fetch Binance Earn (Simple Earn Flexible)
                 if self.data_manager.exchange_id == 'binance':
                     try:
-                        with open("debug_wallet_log.txt", "a") as f:
-                             f.write("Attempting Binance Earn (Flexible) fetch...\n")
+                        _append_debug_wallet_log("Attempting Binance Earn (Flexible) fetch...\n")
                         
                         # Use raw fetch via implicit API if method wrapper missing
                         # Endpoint: GET /sapi/v1/simple-earn/flexible/position
@@ -990,8 +1059,7 @@ class TradingBot:
                             elif isinstance(earn_data, list):
                                 rows = earn_data
                                 
-                            with open("debug_wallet_log.txt", "a") as f:
-                                f.write(f"Earn Rows Found: {len(rows)}\n")
+                            _append_debug_wallet_log(f"Earn Rows Found: {len(rows)}\n")
 
                             for pos in rows:
                                 asset = pos.get('asset')
@@ -1073,6 +1141,32 @@ class TradingBot:
             return True
         return False
 
+    def _append_trade_log(self, record):
+        """
+        Append one record to the JSON-array trade log in place, touching only its tail.
+        Returns False when the file is missing or doesn't end in a JSON array.
+        """
+        try:
+            with open(self.trade_log_file, 'rb+') as f:
+                end = f.seek(0, os.SEEK_END)
+                tail_start = max(0, end - 4096)
+                f.seek(tail_start)
+                tail = f.read().rstrip()
+                if not tail.endswith(b']'):
+                    return False
+                body = tail[:-1].rstrip()
+                if not body or body.endswith(b','):
+                    return False
+                # Same layout json.dump(logs, indent=4) produces, so both writers stay interchangeable
+                entry = '\n'.join('    ' + line for line in json.dumps(record, indent=4).splitlines())
+                sep = b'\n' if body.endswith(b'[') else b',\n'
+                f.seek(tail_start + len(body))
+                f.write(sep + entry.encode('utf-8') + b'\n]')
+                f.truncate()
+            return True
+        except FileNotFoundError:
+            return False
+
     def log_trade(self, decision_packet):
         """
         Self-Audit: Record trade details for post-trade review.
@@ -1113,20 +1207,22 @@ class TradingBot:
         }
         
         try:
-            if os.path.exists(self.trade_log_file):
-                try:
-                    with open(self.trade_log_file, 'r') as f:
-                        logs = json.load(f)
-                except json.JSONDecodeError:
-                    print("Warning: trade_log.json corrupted. specific trade log will be reset.")
+            # Fast path: append without re-reading and rewriting the whole history
+            if not self._append_trade_log(trade_record):
+                if os.path.exists(self.trade_log_file):
+                    try:
+                        with open(self.trade_log_file, 'r') as f:
+                            logs = json.load(f)
+                    except json.JSONDecodeError:
+                        print("Warning: trade_log.json corrupted. specific trade log will be reset.")
+                        logs = []
+                else:
                     logs = []
-            else:
-                logs = []
+                    
+                logs.append(trade_record)
                 
-            logs.append(trade_record)
-            
-            with open(self.trade_log_file, 'w') as f:
-                json.dump(logs, f, indent=4)
+                with open(self.trade_log_file, 'w') as f:
+                    json.dump(logs, f, indent=4)
                 
             # Track Open Position in Memory
             if decision_packet.get('decision') == 'EXECUTE':
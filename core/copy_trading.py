@@ -5,6 +5,38 @@ import time
 from core.bot import TradingBot
 from core.styles import neon_header
 
+# Fallback leaderboard, stored column-wise so the frame is built without per-row dicts
+MOCK_LEADERBOARD = {
+    "Rank": [1, 2, 3, 4, 5],
+    "Trader": ["Master_Alex", "CryptoQueen", "Satoshi_N", "Bear_Hunter", "Altcoin_Gem"],
+    "ROI": ["1,240%", "980%", "850%", "620%", "510%"],
+    "WinRate": ["88%", "82%", "79%", "75%", "71%"],
+    "Followers": [432, 310, 890, 150, 220],
+}
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_leaderboard():
+    """Top-10 leaderboard, shared across reruns so Firestore isn't re-queried on every render."""
+    try:
+        from google.cloud import firestore
+        db = firestore.Client()
+        docs = db.collection('leaderboard').order_by('roi', direction=firestore.Query.DESCENDING).limit(10).stream()
+        
+        data = []
+        rank = 1
+        for doc in docs:
+            d = doc.to_dict()
+            d['Rank'] = rank
+            data.append(d)
+            rank += 1
+            
+        if data:
+            return pd.DataFrame(data)
+    except Exception:
+        pass
+    # Fallback Mock Data (Firestore unavailable or empty)
+    return pd.DataFrame(MOCK_LEADERBOARD)
+
 class CopyTradingModule:
     def __init__(self):
         self.master_config = {
@@ -32,32 +64,7 @@ class CopyTradingModule:
     
     def fetch_leaderboard(self):
         """Fetch Global Leaderboard from Cloud Firestore or return Mock data."""
-        try:
-            from google.cloud import firestore
-            db = firestore.Client()
-            docs = db.collection('leaderboard').order_by('roi', direction=firestore.Query.DESCENDING).limit(10).stream()
-            
-            data = []
-            rank = 1
-            for doc in docs:
-                d = doc.to_dict()
-                d['Rank'] = rank
-                data.append(d)
-                rank += 1
-                
-            if data:
-                return pd.DataFrame(data)
-            else:
-                 raise Exception("No data found")
-        except Exception as e:
-            # Fallback Mock Data
-            return pd.DataFrame([
-                {"Rank": 1, "Trader": "Master_Alex", "ROI": "1,240%", "WinRate": "88%", "Followers": 432},
-                {"Rank": 2, "Trader": "CryptoQueen", "ROI": "980%", "WinRate": "82%", "Followers": 310},
-                {"Rank": 3, "Trader": "Satoshi_N", "ROI": "850%", "WinRate": "79%", "Followers": 890},
-                {"Rank": 4, "Trader": "Bear_Hunter", "ROI": "620%", "WinRate": "75%", "Followers": 150},
-                {"Rank": 5, "Trader": "Altcoin_Gem", "ROI": "510%", "WinRate": "71%", "Followers": 220},
-            ])
+        return load_leaderboard()
 
     def render_ui(self):
         neon_header("Social & Copy Trading Hub", level=1)
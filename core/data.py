@@ -3,6 +3,7 @@ import ccxt
 import pandas as pd
 import logging
 import time
+from requests.adapters import HTTPAdapter
 
 try:
     import yfinance as yf
@@ -15,6 +16,10 @@ from config.exchanges import EXCHANGES
 from config.settings import HTTP_PROXY, HTTPS_PROXY
 import numpy as np
 
+# Keep-alive pool for ccxt's requests.Session (default pool of 10 is shared by all hosts)
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+
 class CustomExchange:
     """
     Fallback class for exchanges not supported by CCXT (e.g. Quidax, NairaEx, Busha).
@@ -160,6 +165,7 @@ class DataManager:
             if exchange_id in ccxt.exchanges:
                 exchange_class = getattr(ccxt, exchange_id)
                 exchange = exchange_class(config)
+                self._mount_pooled_adapter(exchange)
                 
                 # NUCLEAR OPTION: Post-Init Force Replace
                 if exchange_id == 'bybit':
@@ -223,6 +229,17 @@ class DataManager:
             print(f"[ERROR] Error initializing {exchange_id}: {e}. Falling back to CustomExchange.")
             return CustomExchange(exchange_id, config)
 
+    @staticmethod
+    def _mount_pooled_adapter(exchange):
+        """Give the exchange's HTTP session a larger keep-alive pool so TLS connections are reused"""
+        session = getattr(exchange, 'session', None)
+        if session is None or not hasattr(session, 'mount'):
+            return
+        # No max_retries: order endpoints must not be replayed transparently
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
     def set_proxy_mode(self, use_proxy: bool):
         """Re-initialize exchange with or without proxy"""
         print(f"[INFO] Switching Proxy Mode: {'ON' if use_proxy else 'OFF'}")
@@ -148,7 +148,15 @@ class DeFiManager:
         {"constant":False,"inputs":[{"name":"_to","type":"address"},{"name":"_value","type":"uint256"}],"name":"transfer","outputs":[{"name":"","type":"bool"}],"type":"function"}
     ]
 
-    def __init__(self):
+    # Multicall3 is deployed at the same address on all major EVM chains
+    MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+    MULTICALL3_ABI = [
+        {"inputs":[{"components":[{"name":"target","type":"address"},{"name":"allowFailure","type":"bool"},{"name":"callData","type":"bytes"}],"name":"calls","type":"tuple[]"}],"name":"aggregate3","outputs":[{"components":[{"name":"success","type":"bool"},{"name":"returnData","type":"bytes"}],"name":"returnData","type":"tuple[]"}],"stateMutability":"payable","type":"function"}
+    ]
+    BALANCE_OF_SELECTOR = bytes.fromhex('70a08231')
+    DECIMALS_SELECTOR = bytes.fromhex('313ce567')
+
+    def __init__(self, ton_manager=None):
         self.private_key = None
         self.address = None
         
@@ -160,10 +168,10 @@ class DeFiManager:
         self.audit_records = []
         self.dex_clients: Dict[str, DexClient] = {}
 
-        # Initialize sub-managers
+        # Initialize sub-managers (callers may share one TonConnectManager across instances)
         try:
             from core.ton_wallet import TonConnectManager
-            self.ton_manager = TonConnectManager()
+            self.ton_manager = ton_manager or TonConnectManager()
         except ImportError:
             self.ton_manager = None
             print("Warning: TonConnectManager not found.")
@@ -731,6 +739,42 @@ class DeFiManager:
         except Exception:
             return 0.0
 
+    def erc20_balances(self, nc, token_addresses: List[str]) -> List[Optional[float]]:
+        """
+        Balances for several tokens in one eth_call via Multicall3 (balanceOf + decimals per token).
+        A token whose balanceOf/decimals call reverted comes back as None so callers can name it.
+        Falls back to per-token erc20_balance() on non-EVM chains or if the batch call fails.
+        """
+        if not self.address or not token_addresses:
+            return [0.0] * len(token_addresses)
+
+        if self.current_chain == 'ton' or not nc.w3:
+            return [self.erc20_balance(nc, t) for t in token_addresses]
+
+        try:
+            owner = bytes.fromhex(nc.w3.to_checksum_address(self.address)[2:]).rjust(32, b'\0')
+            targets = [nc.w3.to_checksum_address(t) for t in token_addresses]
+            calls = []
+            for target in targets:
+                calls.append((target, True, self.BALANCE_OF_SELECTOR + owner))
+                calls.append((target, True, self.DECIMALS_SELECTOR))
+
+            multicall = nc.w3.eth.contract(address=self.MULTICALL3_ADDRESS, abi=self.MULTICALL3_ABI)
+            results = multicall.functions.aggregate3(calls).call()
+
+            balances = []
+            for i in range(0, len(results), 2):
+                (bal_ok, bal_data), (dec_ok, dec_data) = results[i], results[i + 1]
+                if bal_ok and dec_ok and len(bal_data) >= 32 and len(dec_data) >= 32:
+                    bal = int.from_bytes(bal_data[:32], 'big')
+                    decimals = int.from_bytes(dec_data[:32], 'big')
+                    balances.append(bal / (10 ** decimals))
+                else:
+                    balances.append(None)
+            return balances
+        except Exception:
+            return [self.erc20_balance(nc, t) for t in token_addresses]
+
     def estimate_gas_params(self, nc, priority_gwei: float = 1.5, max_multiplier: float = 2.0) -> Dict[str, int]:
         latest = nc.w3.eth.get_block("latest")
         base_fee = latest.get("baseFeePerGas", None)
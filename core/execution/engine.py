@@ -143,11 +143,12 @@ class ExecutionEngine:
                     try:
                          # Get Real Exchange Balance
                          exchange_bal = 0.0
-                         if hasattr(self.bot, 'wallet_balances'):
+                         if hasattr(self.bot, 'wallet_balance_columns'):
                              # Assuming USDT
-                             usdt_asset = next((x for x in self.bot.wallet_balances if x['asset'] == 'USDT'), None)
-                             if usdt_asset:
-                                 exchange_bal = float(usdt_asset.get('free', 0.0))
+                             cols = self.bot.wallet_balance_columns()
+                             usdt_free = cols['free'][cols['asset'] == 'USDT']
+                             if usdt_free.size:
+                                 exchange_bal = float(usdt_free[0])
                                  
                          # Get Ledger Balance
                          ledger_bal = float(self.bot.storage.get_setting("usdt_balance", 0.0))
@@ -72,6 +72,11 @@ class AdaptiveRiskManager:
                 self.storage.log_balance(self.live_balance, self.live_balance)
                 self.last_log_time = time.time()
 
+    def adjust_live_balance(self, delta):
+        """Apply a delta to the Live Balance (peak + storage logging as in update_live_balance)"""
+        self.update_live_balance(self.live_balance + delta)
+        return self.live_balance
+
     def check_kill_switch(self):
         """
         Check if global kill switch should be activated.
@@ -32,6 +32,7 @@ class SoundEngine:
     def _load_sounds(self):
         """Pre-load sounds into base64 for embedding"""
         self.sounds = {} # Clear existing
+        self._audio_html = {} # sound name -> <audio> tag, built on first play
         
         # Determine path: check pack subdir first, then base dir (legacy)
         pack_path = os.path.join(self.sound_dir, self.current_pack)
@@ -53,11 +54,13 @@ class SoundEngine:
         if not self.enabled:
             return ""
             
-        src = self.sounds.get(sound_name)
-        if src:
-            # Autoplay with hidden attribute
-            return f'<audio autoplay="true" style="display:none;"><source src="{src}" type="audio/wav"></audio>'
-        return ""
+        html = self._audio_html.get(sound_name)
+        if html is None:
+            src = self.sounds.get(sound_name)
+            # Autoplay with hidden attribute; the tag embeds the whole base64 clip, so build it once per pack
+            html = f'<audio autoplay="true" style="display:none;"><source src="{src}" type="audio/wav"></audio>' if src else ""
+            self._audio_html[sound_name] = html
+        return html
 
     def get_ambient_html(self):
         """Return looping ambient sound HTML"""
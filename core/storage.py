@@ -26,6 +26,7 @@ class StorageManager:
         
         self.conn = None
         self.cursor = None
+        self._trades_cache = None # (stamp, DataFrame) for get_trades()
         self.initialize_db()
 
     def initialize_db(self):
@@ -212,10 +213,16 @@ class StorageManager:
             self.cloud_storage.upload_file(self.db_path, "trading_bot.db")
             
     def get_trades(self, limit=50):
-        """Fetch recent trades"""
+        """Fetch recent trades (reuses the last frame until the database changes)"""
         try:
+            # total_changes counts writes on this connection; data_version moves on commits from any other
+            stamp = (limit, self.conn.total_changes, self.conn.execute("PRAGMA data_version").fetchone()[0])
+            if self._trades_cache and self._trades_cache[0] == stamp:
+                return self._trades_cache[1]
             query = f"SELECT * FROM trades ORDER BY timestamp DESC LIMIT {limit}"
-            return pd.read_sql_query(query, self.conn)
+            trades = pd.read_sql_query(query, self.conn)
+            self._trades_cache = (stamp, trades)
+            return trades
         except Exception as e:
             print(f"[Storage] Get Trades Error: {e}")
             return pd.DataFrame()
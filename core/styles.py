@@ -372,6 +372,42 @@ div[data-testid="stToast"] {
     gap: 15px;
 }
 
+/* --- WALLET CONNECT --- */
+.wallet-panel {
+    background-color: #111827;
+    padding: 1.5rem;
+    border-radius: 0.5rem;
+    border: 1px solid #374151;
+    margin-bottom: 5px;
+}
+.wallet-panel h3 {
+    font-size: 1.125rem;
+    font-weight: 700;
+    color: #4ade80;
+    margin: 0 0 10px 0;
+}
+.wallet-panel p {
+    font-size: 0.875rem;
+    color: #d1d5db;
+    margin-bottom: 5px;
+}
+.wallet-key-warning {
+    font-size: 0.75rem;
+    color: #ef4444;
+    margin-top: 5px;
+    margin-bottom: 15px;
+}
+.section-banner {
+    padding: 10px;
+    border-radius: 5px;
+    text-align: center;
+    margin-bottom: 20px;
+    font-weight: bold;
+    color: white;
+}
+.section-banner.exchange { background: linear-gradient(90deg, #10b981, #059669); }
+.section-banner.wallet { background: linear-gradient(90deg, #00f2ff, #2563eb); }
+
 /* --- RESPONSIVENESS --- */
 @media (max-width: 768px) {
     .control-panel-container {
@@ -3,6 +3,7 @@ import random
 import json
 import logging
 import requests
+from collections import OrderedDict
 from datetime import datetime
 
 class TonConnectManager:
@@ -11,6 +12,9 @@ class TonConnectManager:
     In a production environment with 'pytonconnect' installed, this would interface with the actual bridge.
     """
     
+    # Upper bound on cached per-address balances (LRU eviction)
+    MAX_CACHED_BALANCES = 128
+    
     def __init__(self):
         self.manifest_url = "https://caparox.app/tonconnect-manifest.json"
         self.bridge_url = "https://bridge.tonapi.io/bridge"
@@ -19,8 +23,8 @@ class TonConnectManager:
             {"name": "Tonkeeper", "image": "https://tonkeeper.com/assets/tonkeeper.png", "app_name": "tonkeeper"},
             {"name": "MyTonWallet", "image": "https://mytonwallet.io/icon-256.png", "app_name": "mytonwallet"}
         ]
-        # Store balances for simulation (Address -> {TON: float, USDT: float})
-        self.balances = {}
+        # Store balances for simulation (Address -> {TON: float, USDT: float}), LRU-bounded
+        self.balances = OrderedDict()
 
         
     def get_wallets(self):
@@ -88,6 +92,7 @@ class TonConnectManager:
         # Note: If we want to refresh real balance, we might need a force_refresh flag.
         # For now, let's prioritize cached if it exists to preserve "trading" updates in simulation.
         if address in self.balances:
+            self.balances.move_to_end(address)
             return self.balances[address]
 
         # Try to fetch REAL balance
@@ -126,11 +131,10 @@ class TonConnectManager:
 
             if found:
                 # Store
-                self.balances[address] = {
+                return self._store_balance(address, {
                     "TON": round(real_balance, 4),
                     "USDT": 0.0 # TODO: Fetch Jetton balance
-                }
-                return self.balances[address]
+                })
                 
         except Exception as e:
             logging.warning(f"Failed to fetch real TON balance: {e}")
@@ -138,6 +142,14 @@ class TonConnectManager:
         # Fallback: Return 0.0 (No fake data)
         return {"TON": 0.0, "USDT": 0.0}
 
+    def _store_balance(self, address, balance):
+        """Cache a balance, evicting the least recently used address when full"""
+        self.balances[address] = balance
+        self.balances.move_to_end(address)
+        while len(self.balances) > self.MAX_CACHED_BALANCES:
+            self.balances.popitem(last=False)
+        return balance
+
     def estimate_gas(self, transaction_type):
         """
         Estimate gas fees for a transaction.
@@ -76,6 +76,15 @@ class OracleManager:
     Simulates Chainlink Oracle interactions for verifiable price feeds.
     """
     
+    # Simulated Prices (built once, not per lookup)
+    SIMULATED_PRICES = {
+        "ETH": 2250.00,
+        "BTC": 42000.00,
+        "SOL": 95.00,
+        "BNB": 310.00,
+        "AVAX": 35.00
+    }
+    
     @staticmethod
     def get_price_feed(asset: str, chain: str) -> float:
         """
@@ -84,13 +93,4 @@ class OracleManager:
         # In a real app, this would call a smart contract:
         # price_feed = web3.eth.contract(address=addr, abi=abi)
         # return price_feed.functions.latestRoundData().call()
-        
-        # Simulated Prices
-        prices = {
-            "ETH": 2250.00,
-            "BTC": 42000.00,
-            "SOL": 95.00,
-            "BNB": 310.00,
-            "AVAX": 35.00
-        }
-        return prices.get(asset, 0.0)
+        return OracleManager.SIMULATED_PRICES.get(asset, 0.0)
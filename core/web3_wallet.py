@@ -4,6 +4,7 @@ import logging
 import requests
 import time
 import io
+import re
 try:
     import qrcode
 except ImportError:
@@ -14,6 +15,17 @@ try:
 except ImportError:
     Tron = None
 
+# Default ERC20 tokens probed by scan_tokens(): {'ChainName': {'Symbol': 'Address'}}
+DEFAULT_TOKEN_MAP = {
+    'Ethereum': {
+        'USDT': '0xdAC17F958D2ee523a2206206994597C13D831ec7',
+        'USDC': '0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48'
+    }
+}
+
+# Raw EVM private key: 32 bytes hex, optional 0x prefix
+EVM_KEY_PATTERN = re.compile(r'^(0x)?[0-9a-fA-F]{64}$')
+
 class Web3Wallet:
     def __init__(self):
         # Chain Configuration
@@ -157,7 +169,7 @@ class Web3Wallet:
         # 1. Check if input is a Private Key (EVM mainly)
         # EVM Keys are 64 hex chars (32 bytes), sometimes with 0x
         is_private_key = False
-        if len(input_str) >= 64:
+        if EVM_KEY_PATTERN.match(input_str):
             try:
                 # Try deriving address from key (EVM)
                 account = Account.from_key(input_str)
@@ -174,31 +186,32 @@ class Web3Wallet:
                 self.connected = True
                 return True
             except Exception:
-                # Not a valid EVM key, check for Solana/Tron
-                if input_str.startswith('5') or input_str.startswith('6'): # Simple heuristic for Sol PK
-                     # Solana private key
-                     try:
-                         from solders.keypair import Keypair
-                         # Assuming input_str is base58 encoded
-                         import base58
-                         kp = Keypair.from_base58_string(input_str)
-                         self.chain_id = 'solana'
-                         self.address = str(kp.pubkey())
-                         self.private_key = input_str
-                         self.connected = True
-                         return True
-                     except ImportError:
-                         # Fail if solders not installed - do not mock
-                         logging.error("Solana libraries not installed. Cannot derive address from private key.")
-                         return False
-                     except Exception as e:
-                         logging.error(f"Invalid Solana Private Key: {e}")
-                         return False
-                         
-                elif input_str.startswith('T'):
-                     # Tron private key logic would go here
-                     pass
                 pass
+        elif len(input_str) >= 64:
+            # Not an EVM key, check for Solana/Tron
+            if input_str.startswith('5') or input_str.startswith('6'): # Simple heuristic for Sol PK
+                 # Solana private key
+                 try:
+                     from solders.keypair import Keypair
+                     # Assuming input_str is base58 encoded
+                     import base58
+                     kp = Keypair.from_base58_string(input_str)
+                     self.chain_id = 'solana'
+                     self.address = str(kp.pubkey())
+                     self.private_key = input_str
+                     self.connected = True
+                     return True
+                 except ImportError:
+                     # Fail if solders not installed - do not mock
+                     logging.error("Solana libraries not installed. Cannot derive address from private key.")
+                     return False
+                 except Exception as e:
+                     logging.error(f"Invalid Solana Private Key: {e}")
+                     return False
+                     
+            elif input_str.startswith('T'):
+                 # Tron private key logic would go here
+                 pass
 
         if is_private_key:
             return True
@@ -872,13 +885,7 @@ class Web3Wallet:
         token_map: {'ChainName': {'Symbol': 'Address'}}
         """
         if not token_map:
-             # Default from user request
-             token_map = {
-                 'Ethereum': {
-                     'USDT': '0xdAC17F958D2ee523a2206206994597C13D831ec7',
-                     'USDC': '0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48'
-                 }
-             }
+             token_map = DEFAULT_TOKEN_MAP
         
         results = {}
         for chain_name, tokens in token_map.items():
@@ -4,6 +4,10 @@ try:
     from tenacity import RetryError
 except ImportError:
     class RetryError(Exception): pass
+try:
+    import orjson as _trade_json  # faster trade-log parse when installed
+except ImportError:
+    import json as _trade_json
 
 # Apply DNS Fix immediately
 try:
@@ -17,6 +21,9 @@ import sys
 import os
 import importlib
 import base64
+import json
+from concurrent.futures import ThreadPoolExecutor
+import streamlit.components.v1 as components
 import io
 import qrcode
 from PIL import Image
@@ -74,15 +81,28 @@ import core.risk
 # import core.bot         # Optimization: defer
 import core.ui_components
 from core.auth import AuthManager, UserManager, TOTP, SessionManager
-from core.ton_wallet import TonConnectManager
 from core.web3_wallet import Web3Wallet
 # from core.defi import DeFiManager # Optimization: defer
 import pandas as pd
 from config.settings import APP_NAME, VERSION, DEFAULT_SYMBOL
 
+@st.cache_resource
+def _found_assets():
+    return {}
+
+def asset_path(name):
+    """Resolve a bundled asset; hits are remembered per process, misses are re-checked so a later-added file is picked up"""
+    found = _found_assets()
+    if name not in found:
+        path = os.path.join("assets", name)
+        if not os.path.exists(path):
+            return None
+        found[name] = path
+    return found[name]
+
 # Determine Page Icon (Logo or Emoji)
-logo_path = os.path.join("assets", "logo.png")
-page_icon = logo_path if os.path.exists(logo_path) else "🦅"
+logo_path = asset_path("logo.png")
+page_icon = logo_path or "🦅"
 
 # st.set_page_config(
 #     page_title=APP_NAME, 
@@ -116,35 +136,55 @@ if 'logged_in' not in st.session_state:
 if 'login_stage' not in st.session_state:
     st.session_state.login_stage = 'credentials'
 
+def store_session_token(token):
+    """Persist (or clear, if token is None) the session token in browser localStorage"""
+    if token is None:
+        js = "window.parent.localStorage.removeItem('capacitybay_session');"
+    else:
+        js = f"window.parent.localStorage.setItem('capacitybay_session', {json.dumps(token)});"
+    components.html(f"<script>{js}</script>", height=0)
+
+# Snapshot query params once per rerun; the proxy is only touched to mutate
+query_params = dict(st.query_params)
+session_id = query_params.get("session_id", None)
+logout_reason = query_params.get("logout", None)
+
 # --- Session Management & Persistence ---
+SESSION_IDLE_TIMEOUT = 7200
+SESSION_IDLE_WARNING = 6900
+CEX_SYNC_INTERVAL = 15
+
+def touch_session(now=None):
+    """Push the idle-timeout deadlines forward from `now` (monotonic clock)"""
+    now = time.monotonic() if now is None else now
+    st.session_state.session_deadline = now + SESSION_IDLE_TIMEOUT
+    st.session_state.session_warn_at = now + SESSION_IDLE_WARNING
+
 if st.session_state.get('logged_in'):
-    last_active = st.session_state.get('last_active', time.time())
-    idle_duration = time.time() - last_active
+    now = time.monotonic()
+    if 'session_deadline' not in st.session_state:
+        touch_session(now)
     
-    if idle_duration > 7200:
+    if now > st.session_state.session_deadline:
         st.session_state.logged_in = False
         st.session_state.username = None
         st.query_params["logout"] = "timeout"
-        if "session_id" in st.query_params:
+        if "session_id" in query_params:
             del st.query_params["session_id"]
-        st.markdown("<script>localStorage.removeItem('capacitybay_session');</script>", unsafe_allow_html=True)
+        store_session_token(None)
         st.rerun()
-    elif idle_duration > 6900:
-        mins_left = int((7200 - idle_duration) / 60)
+    elif now > st.session_state.session_warn_at:
+        mins_left = int((st.session_state.session_deadline - now) / 60)
         st.toast(f"⚠️ Session expiring in {mins_left} minutes due to inactivity.", icon="⏳")
     
-    st.session_state.last_active = time.time()
-
-query_params = st.query_params
-session_id = query_params.get("session_id", None)
-logout_reason = query_params.get("logout", None)
+    touch_session(now)
 
 if logout_reason == "timeout":
     st.error("Session expired due to inactivity.")
     if 'logged_in' in st.session_state and st.session_state.logged_in:
         st.session_state.logged_in = False
         st.session_state.username = None
-    st.markdown("<script>localStorage.removeItem('capacitybay_session');</script>", unsafe_allow_html=True)
+    store_session_token(None)
 
 if not st.session_state.logged_in and session_id:
     username = st.session_state.session_manager.validate_session(session_id)
@@ -154,16 +194,18 @@ if not st.session_state.logged_in and session_id:
         st.session_state.session_token = session_id
         st.session_state.user_manager = UserManager(username)
         st.session_state.user_role = st.session_state.auth_manager.users.get(username, {}).get('role', 'demo')
-        st.session_state.last_active = time.time()
+        touch_session()
         st.success(f"Welcome back, {username}!")
     else:
         st.error("Session expired or invalid.")
-        if "session_id" in st.query_params:
+        if "session_id" in query_params:
             del st.query_params["session_id"]
-        st.markdown("<script>localStorage.removeItem('capacitybay_session');</script>", unsafe_allow_html=True)
+        store_session_token(None)
 
-if not st.session_state.logged_in and not session_id and not logout_reason:
+# Restore a saved session token once per browser session, not on every login-form rerun
+if not st.session_state.logged_in and not session_id and not logout_reason and not st.session_state.get('_bootstrap_injected'):
     st.markdown("<script>const token = localStorage.getItem('capacitybay_session');if (token) {window.location.search = '?session_id=' + token;}</script>", unsafe_allow_html=True)
+    st.session_state._bootstrap_injected = True
 
 if 'sound_queue' not in st.session_state:
     st.session_state.sound_queue = []
@@ -225,10 +267,28 @@ def get_cached_fundamentals(symbol, _bot):
 def get_cached_sentiment(_bot):
     return _bot.fundamentals.get_market_sentiment()
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def build_tv_widget_html(tv_symbol, tv_interval):
+    """TradingView advanced-chart embed for a symbol/interval pair"""
+    return f'<div class="tradingview-widget-container" style="height:600px;width:100%"><div class="tradingview-widget-container__widget" style="height:calc(100% - 32px);width:100%"></div><script type="text/javascript" src="https://s3.tradingview.com/external-embedding/embed-widget-advanced-chart.js" async>{{"autosize": true, "symbol": "{tv_symbol}", "interval": "{tv_interval}", "timezone": "Etc/UTC", "theme": "dark", "style": "1", "locale": "en", "enable_publishing": false, "allow_symbol_change": true, "support_host": "https://www.tradingview.com"}}</script></div>'
+
 @st.cache_data(ttl=10)
 def get_cached_ohlcv(_bot, symbol, timeframe, limit=200):
     return _bot.data_manager.fetch_ohlcv(symbol, timeframe, limit=limit)
 
+@st.cache_data(ttl=10, show_spinner=False)
+def get_cached_ohlcv_stats(_bot, symbol, timeframe, limit=200):
+    """(df, last close, close-to-close return std) so refresh ticks skip the pct_change pass"""
+    df = get_cached_ohlcv(_bot, symbol, timeframe, limit=limit)
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        return df, None, None
+    close = df['close'].to_numpy(dtype=float)
+    vol = 0.02
+    if len(close) > 30:
+        returns = np.diff(close) / close[:-1]
+        vol = float(np.nanstd(returns, ddof=1))
+    return df, float(close[-1]), vol
+
 @st.cache_data(ttl=60)
 def get_cached_analysis(_bot, df):
     if df.empty:
@@ -239,10 +299,132 @@ def get_cached_analysis(_bot, df):
 def get_cached_prediction(_bot, df):
     return _bot.brain.predict_next_move(df)
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_cached_probability_wave(_qe, price, vol, time_horizon=10):
+    # Keyed on rounded inputs so fragment ticks with an unchanged
+    # price/vol reuse the same frame instead of rebuilding it.
+    x, pdf = _qe.calculate_probability_wave(price, vol, time_horizon=time_horizon)
+    return pd.DataFrame({"prob": pdf}, index=pd.Index(x, name="price"))
+
 @st.cache_data(ttl=15)
 def get_cached_ticker(_bot, symbol):
     return _bot.data_manager.fetch_ticker(symbol)
 
+TRADE_LOG_FILE = "trade_log.json"
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def load_trade_history(path, stamp):
+    """Trade log flattened into the history table; `stamp` is (mtime_ns, size) so writes invalidate it"""
+    try:
+        with open(path, "rb") as f:
+            history = _trade_json.loads(f.read())
+    except (OSError, ValueError):
+        return pd.DataFrame()
+    # Handle different formats if log structure varies
+    return pd.DataFrame([{
+        "Time": t.get("timestamp", t.get("time", "")),
+        "Side": t.get("side", "").upper(),
+        "Symbol": t.get("symbol", ""),
+        "Qty": t.get("amount", 0),
+        "Entry": t.get("price", t.get("entry_price", 0)),
+        "Exit": t.get("exit_price", "-"),
+        "PnL": t.get("pnl", "-"),
+        "Reason": t.get("strategy", t.get("reason", "Manual"))
+    } for t in history])
+
+def get_trade_history(path=TRADE_LOG_FILE):
+    """Cached history table, or None when there is no log file yet"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return load_trade_history(path, (stat.st_mtime_ns, stat.st_size))
+
+TICKER_FETCH_WORKERS = 8
+
+@st.cache_data(ttl=15, show_spinner=False)
+def get_cached_tickers(_bot, exchange_id, symbols):
+    """
+    Tickers for several symbols, fetched concurrently instead of one round-trip per symbol.
+    `exchange_id` is only part of the cache key (`_bot` is unhashed); a failed symbol maps to None.
+    """
+    if not symbols:
+        return {}
+    dm = _bot.data_manager
+
+    def fetch(symbol):
+        try:
+            return dm.fetch_ticker(symbol)
+        except Exception:
+            return None
+
+    # Load markets once up front so the worker threads don't race to do it
+    try:
+        dm.ensure_markets_loaded()
+    except Exception:
+        pass
+    with ThreadPoolExecutor(max_workers=min(TICKER_FETCH_WORKERS, len(symbols))) as pool:
+        return dict(zip(symbols, pool.map(fetch, symbols)))
+
+@st.cache_data(ttl=10)
+def get_cached_wallet_balance(_wallet, address, chain_id):
+    """Native wallet balance, keyed by (address, chain) so reruns skip the RPC"""
+    return _wallet.get_balance()
+
+@st.cache_data(ttl=10)
+def get_cached_portfolio_value(_wallet, address, chain_id):
+    return _wallet.get_portfolio_value_usd()
+
+def clear_wallet_caches(wallet):
+    """Evict only this wallet's cached lookups; the caches are shared by every session"""
+    get_cached_wallet_balance.clear(wallet, wallet.address, wallet.chain_id)
+    get_cached_portfolio_value.clear(wallet, wallet.address, wallet.chain_id)
+
+def set_session_state(**updates):
+    """Button on_click callback: apply state before the click's own rerun, so no extra st.rerun() is needed"""
+    for key, value in updates.items():
+        st.session_state[key] = value
+
+def describe_error(e):
+    """Error text for the UI; a tenacity RetryError reports its last attempt's cause instead"""
+    if isinstance(e, RetryError):
+        attempt = getattr(e, 'last_attempt', None)
+        cause = attempt.exception() if attempt is not None else None
+        if cause is not None:
+            return str(cause)
+    return str(e)
+
+SYNC_KEY_ERROR_MARKERS = ('-2008', 'CRITICAL_API_ERROR')
+
+def _handle_sync_error(exchange, e, report=st.error):
+    """Report a failed balance sync; a rejected API key also drops the CEX connection"""
+    msg = str(e)
+    if any(tok in msg for tok in SYNC_KEY_ERROR_MARKERS):
+        # bot.sync_live_balance() has already stripped the keys from the exchange client
+        st.session_state.exchange_connected = False
+        st.session_state[f"{exchange}_connected"] = False
+        report(f"🔑 {exchange.title()} rejected the API key. Re-enter your credentials in Settings.")
+    else:
+        report(f"Sync failed: {msg}")
+
+def apply_trading_mode(bot, mode):
+    """
+    set_trading_mode() rebuilds the exchange client and syncs the balance, so only call it
+    when the applied (risk manager) mode changes; otherwise re-assert the cheap state it sets.
+    Returns True on an actual switch.
+    """
+    if bot.risk_manager.mode != mode:
+        bot.set_trading_mode(mode)
+        return True
+    bot.trading_mode = mode  # get_bot() may have defaulted it to CEX_Direct this run
+    bot.risk_manager.open_positions = bot.positions.get(mode, [])
+    return False
+
+@st.cache_data(ttl=10, show_spinner=False)
+def get_cached_gas_params(_defi, _nc, chain):
+    """EIP-1559/legacy fee params for the fee caption, shared across widget reruns"""
+    return _defi.estimate_gas_params(_nc)
+
 @st.cache_data(ttl=15)
 def get_cached_price(_bot, symbol):
     t = get_cached_ticker(_bot, symbol)
@@ -264,7 +446,7 @@ def check_alerts(bot_instance):
         try:
             ticker = get_cached_ticker(bot_instance, sym)
             prices[sym] = ticker.get('last')
-        except:
+        except Exception:
             prices[sym] = None
             
     for i, alert in enumerate(st.session_state.alerts):
@@ -288,7 +470,116 @@ def check_alerts(bot_instance):
         st.toast(f"🔔 ALERT: {alert['symbol']} is {alert['condition']} {alert['value']} (Current: {price})", icon="🔔")
         st.session_state.alerts[i]['active'] = False
 
+@st.cache_resource
+def get_login_css():
+    """Login form styles (constant, built once per server process)"""
+    return '<style>.block-container { padding-top: 0rem !important; padding-bottom: 0rem !important; } [data-testid="stForm"] { background-color: rgba(20, 25, 35, 0.8); border: 1px solid rgba(0, 242, 255, 0.2); border-radius: 15px; padding: 1.5rem; box-shadow: 0 0 20px rgba(0, 0, 0, 0.5); margin-top: 0px; } @media (max-width: 768px) { div[data-testid="column"] { width: 100% !important; flex: 1 1 auto !important; min-width: 100% !important; } .block-container { padding-top: 0rem !important; } [data-testid="stForm"] { padding: 1.5rem; margin-top: 0rem; } .login-header h1 { font-size: 2rem !important; } .login-header { margin-bottom: 15px !important; } } .stTextInput input { background-color: rgba(10, 14, 23, 0.9) !important; border: 1px solid rgba(255, 255, 255, 0.1) !important; color: white !important; } .stTextInput input:focus { border-color: #00f2ff !important; box-shadow: 0 0 10px rgba(0, 242, 255, 0.2) !important; } .stTabs [data-baseweb="tab-list"] { gap: 10px; background-color: transparent; } .stTabs [data-baseweb="tab"] { background-color: rgba(255, 255, 255, 0.05); border-radius: 5px; color: #94a3b8; padding: 8px 16px; border: none; } .stTabs [aria-selected="true"] { background-color: rgba(0, 242, 255, 0.1) !important; color: #00f2ff !important; border: 1px solid rgba(0, 242, 255, 0.3) !important; }</style>'
+
+@st.cache_resource
+def get_wallet_form_html():
+    """Static markup for the manual wallet-connect form (built once per server process)"""
+    # Styling lives in the global stylesheet (core/styles.py) so only class names are sent per render
+    return {
+        'panel': '<div class="wallet-panel"><h3>🔐 Manual Private Key Entry</h3><p>Enter your private key securely below. It is used locally for signing only.</p></div>',
+        'warning': '<p class="wallet-key-warning">⚠️ Never share your private key. It will only be used locally for signing transactions.</p>',
+    }
+
 # --- Authentication Logic ---
+@st.fragment
+def render_login_ui():
+    """Login / 2FA forms; scoped as a fragment so form interaction doesn't rerun the app"""
+    if st.session_state.login_stage == 'credentials':
+        tab_login, tab_reg = st.tabs(["ACCESS TERMINAL", "NEW OPERATOR"])
+
+        with tab_login:
+            with st.form("login_form"):
+                username = st.text_input("Username", key="login_user")
+                password = st.text_input("Password", type="password", key="login_pass")
+                remember_me = st.checkbox("Remember Me", value=True)
+                submitted = st.form_submit_button("Login", type="primary")
+
+            if submitted:
+                if not username or not password:
+                    st.warning("Please enter both username and password.")
+                else:
+                    with st.spinner("Authenticating..."):
+                        time.sleep(0.5)
+                        success, result = st.session_state.auth_manager.login_user(username, password)
+                        if success:
+                            if result.get('2fa_enabled', False):
+                                st.session_state.login_stage = '2fa'
+                                st.session_state.temp_user_data = result
+                                st.session_state.remember_me = remember_me
+                                st.rerun()
+                            else:
+                                st.session_state.logged_in = True
+                                st.session_state.username = username
+                                st.session_state.user_role = result['role']
+                                st.session_state.user_manager = UserManager(username)
+                                touch_session()
+                                token = st.session_state.session_manager.create_session(username, remember_me)
+                                st.session_state.session_token = token
+                                st.query_params["session_id"] = token
+                                store_session_token(token)
+                                st.session_state.sound_queue.append("connect")
+                                st.success("Login Successful!")
+                                st.rerun()
+                        else:
+                            st.error(result)
+
+        with tab_reg:
+            with st.form("register_form"):
+                new_user = st.text_input("New Username", key="reg_user")
+                new_pass = st.text_input("New Password", type="password", key="reg_pass")
+                new_email = st.text_input("Email", key="reg_email")
+                reg_submitted = st.form_submit_button("Register")
+
+            if reg_submitted:
+                if not new_user or not new_pass:
+                    st.warning("Username and Password are required.")
+                else:
+                    with st.spinner("Creating Account..."):
+                        time.sleep(0.5)
+                        success, msg = st.session_state.auth_manager.register_user(new_user, new_pass, new_email)
+                        if success:
+                            st.success(msg)
+                        else:
+                            st.error(msg)
+
+    elif st.session_state.login_stage == '2fa':
+        neon_header("Two-Factor Authentication", level=2)
+        with st.form("2fa_form"):
+            code = st.text_input("Enter 6-digit 2FA Code", max_chars=6, key="2fa_code_input")
+            verify_submit = st.form_submit_button("Verify", type="primary")
+
+        if verify_submit:
+            with st.spinner("Verifying 2FA..."):
+                time.sleep(0.3)
+                username = st.session_state.login_user
+                if st.session_state.auth_manager.verify_2fa_login(username, code):
+                    st.session_state.logged_in = True
+                    st.session_state.username = username
+                    # Restore user data
+                    result = st.session_state.temp_user_data
+                    st.session_state.user_role = result['role']
+                    st.session_state.user_manager = UserManager(username)
+                    touch_session()
+                    token = st.session_state.session_manager.create_session(username, st.session_state.remember_me)
+                    st.session_state.session_token = token
+                    st.query_params["session_id"] = token
+                    store_session_token(token)
+                    st.session_state.login_stage = 'credentials'
+                    st.session_state.temp_user_data = None
+                    st.session_state.remember_me = None
+                    st.session_state.sound_queue.append("connect")
+                    st.success("Login Successful!")
+                    st.rerun()
+                else:
+                    st.error("Invalid 2FA Code")
+
+        st.button("Cancel", on_click=set_session_state,
+                  kwargs={'login_stage': 'credentials', 'temp_user_data': None})
+
 if not st.session_state.logged_in:
     col1, col2, col3 = st.columns([1, 1.2, 1])
     with col2:
@@ -296,112 +587,23 @@ if not st.session_state.logged_in:
 
         
         with st.container():
-            st.markdown('<style>.block-container { padding-top: 0rem !important; padding-bottom: 0rem !important; } [data-testid="stForm"] { background-color: rgba(20, 25, 35, 0.8); border: 1px solid rgba(0, 242, 255, 0.2); border-radius: 15px; padding: 1.5rem; box-shadow: 0 0 20px rgba(0, 0, 0, 0.5); margin-top: 0px; } @media (max-width: 768px) { div[data-testid="column"] { width: 100% !important; flex: 1 1 auto !important; min-width: 100% !important; } .block-container { padding-top: 0rem !important; } [data-testid="stForm"] { padding: 1.5rem; margin-top: 0rem; } .login-header h1 { font-size: 2rem !important; } .login-header { margin-bottom: 15px !important; } } .stTextInput input { background-color: rgba(10, 14, 23, 0.9) !important; border: 1px solid rgba(255, 255, 255, 0.1) !important; color: white !important; } .stTextInput input:focus { border-color: #00f2ff !important; box-shadow: 0 0 10px rgba(0, 242, 255, 0.2) !important; } .stTabs [data-baseweb="tab-list"] { gap: 10px; background-color: transparent; } .stTabs [data-baseweb="tab"] { background-color: rgba(255, 255, 255, 0.05); border-radius: 5px; color: #94a3b8; padding: 8px 16px; border: none; } .stTabs [aria-selected="true"] { background-color: rgba(0, 242, 255, 0.1) !important; color: #00f2ff !important; border: 1px solid rgba(0, 242, 255, 0.3) !important; }</style>', unsafe_allow_html=True)
+            st.markdown(get_login_css(), unsafe_allow_html=True)
             
-            if st.session_state.login_stage == 'credentials':
-                tab_login, tab_reg = st.tabs(["ACCESS TERMINAL", "NEW OPERATOR"])
-                
-                with tab_login:
-                    with st.form("login_form"):
-                        username = st.text_input("Username", key="login_user")
-                        password = st.text_input("Password", type="password", key="login_pass")
-                        remember_me = st.checkbox("Remember Me", value=True)
-                        submitted = st.form_submit_button("Login", type="primary")
-                    
-                    if submitted:
-                        if not username or not password:
-                            st.warning("Please enter both username and password.")
-                        else:
-                            with st.spinner("Authenticating..."):
-                                time.sleep(0.5)
-                                success, result = st.session_state.auth_manager.login_user(username, password)
-                                if success:
-                                    if result.get('2fa_enabled', False):
-                                        st.session_state.login_stage = '2fa'
-                                        st.session_state.temp_user_data = result
-                                        st.session_state.remember_me = remember_me
-                                        st.rerun()
-                                    else:
-                                        st.session_state.logged_in = True
-                                        st.session_state.username = username
-                                        st.session_state.user_role = result['role']
-                                        st.session_state.user_manager = UserManager(username)
-                                        st.session_state.last_active = time.time()
-                                        token = st.session_state.session_manager.create_session(username, remember_me)
-                                        st.session_state.session_token = token
-                                        st.query_params["session_id"] = token
-                                        st.markdown(f"<script>localStorage.setItem('capacitybay_session', '{token}');</script>", unsafe_allow_html=True)
-                                        st.session_state.sound_queue.append("connect")
-                                        st.success("Login Successful!")
-                                        st.rerun()
-                                else:
-                                    st.error(result)
-
-                with tab_reg:
-                    with st.form("register_form"):
-                        new_user = st.text_input("New Username", key="reg_user")
-                        new_pass = st.text_input("New Password", type="password", key="reg_pass")
-                        new_email = st.text_input("Email", key="reg_email")
-                        reg_submitted = st.form_submit_button("Register")
-                    
-                    if reg_submitted:
-                        if not new_user or not new_pass:
-                            st.warning("Username and Password are required.")
-                        else:
-                            with st.spinner("Creating Account..."):
-                                time.sleep(0.5)
-                                success, msg = st.session_state.auth_manager.register_user(new_user, new_pass, new_email)
-                                if success:
-                                    st.success(msg)
-                                else:
-                                    st.error(msg)
-        
-            elif st.session_state.login_stage == '2fa':
-                neon_header("Two-Factor Authentication", level=2)
-                with st.form("2fa_form"):
-                    code = st.text_input("Enter 6-digit 2FA Code", max_chars=6, key="2fa_code_input")
-                    verify_submit = st.form_submit_button("Verify", type="primary")
-                
-                if verify_submit:
-                    with st.spinner("Verifying 2FA..."):
-                        time.sleep(0.3)
-                        username = st.session_state.login_user
-                        if st.session_state.auth_manager.verify_2fa_login(username, code):
-                            st.session_state.logged_in = True
-                            st.session_state.username = username
-                            # Restore user data
-                            result = st.session_state.temp_user_data
-                            st.session_state.user_role = result['role']
-                            st.session_state.user_manager = UserManager(username)
-                            st.session_state.last_active = time.time()
-                            token = st.session_state.session_manager.create_session(username, st.session_state.remember_me)
-                            st.session_state.session_token = token
-                            st.query_params["session_id"] = token
-                            st.markdown(f"<script>localStorage.setItem('capacitybay_session', '{token}');</script>", unsafe_allow_html=True)
-                            st.session_state.login_stage = 'credentials'
-                            st.session_state.temp_user_data = None
-                            st.session_state.remember_me = None
-                            st.session_state.sound_queue.append("connect")
-                            st.success("Login Successful!")
-                            st.rerun()
-                        else:
-                            st.error("Invalid 2FA Code")
-
-                if st.button("Cancel"):
-                    st.session_state.login_stage = 'credentials'
-                    st.session_state.temp_user_data = None
-                    st.rerun()
+            render_login_ui()
 
     st.stop()
 
 # --- Main Dashboard ---
 import pandas as pd
 import numpy as np
+import pyarrow as pa # ships with streamlit
 import subprocess
 import signal
-import streamlit.components.v1 as components
-from config.trading_config import TRADING_CONFIG
-import json
+from config.ui_constants import (
+    CHAIN_NATIVE_SYMBOLS, FALLBACK_USD_PRICES, WALLET_GRID_COLUMNS, WALLET_DEFAULT_CHAINS,
+    EXCHANGE_DEPOSIT_URLS, SUPPORTED_EXCHANGES, TARGET_APR_LABEL, TV_INTERVAL_MAP,
+    WEB3_SWITCH_USD_PRICES, WEB3_SYNC_USD_PRICES, IMPORT_WALLET_NETWORKS
+)
 import importlib
 import core.data
 import core.risk
@@ -415,9 +617,25 @@ if 'loaded_core_version' not in st.session_state:
 
 # Lazy imports implemented to reduce initial load time
 # from core.bot import TradingBot -> Moved to get_bot
-# from core.defi import DeFiManager -> Moved to usage
-# from core.auto_trader import AutoTrader -> Moved to usage
-# ...
+# Sub-page modules are resolved through lazy_class() on first use, so their
+# dependency graphs (ML libs, web3, ...) only load when that page is visited.
+LAZY_CLASSES = {
+    'AutoTrader': 'core.auto_trader',
+    'NLPEngine': 'core.nlp_engine',
+    'CopyTradingModule': 'core.copy_trading',
+    'DeFiManager': 'core.defi',
+    'TonConnectManager': 'core.ton_wallet',
+}
+
+def lazy_class(name):
+    """Import the module owning `name` on first use and return the class"""
+    return getattr(importlib.import_module(LAZY_CLASSES[name]), name)
+
+def get_ton_manager():
+    """One TonConnectManager per session: its simulated balances are per-user state, so not process-wide"""
+    if 'ton_manager' not in st.session_state:
+        st.session_state.ton_manager = lazy_class('TonConnectManager')()
+    return st.session_state.ton_manager
 
 if 'sound_engine' not in st.session_state:
     from core.sound_engine import SoundEngine
@@ -449,9 +667,6 @@ exchange = st.session_state.exchange
 
 # 1. TRADING DASHBOARD
 if page_nav == "Trading Dashboard":
-    import plotly.graph_objects as go
-    from plotly.subplots import make_subplots
-    
     # --- INITIALIZE BOT ---
     try:
         bot = get_bot(exchange)
@@ -459,18 +674,19 @@ if page_nav == "Trading Dashboard":
         bot.timeframe = timeframe
         
         if 'nlp_engine' not in st.session_state:
-            st.session_state.nlp_engine = NLPEngine(bot)
+            st.session_state.nlp_engine = lazy_class('NLPEngine')(bot)
         else:
             st.session_state.nlp_engine.bot = bot
             
         # Audio Alerts
-        if 'sound_queue' in st.session_state and st.session_state.sound_queue:
-            unique_sounds = list(dict.fromkeys(st.session_state.sound_queue))
-            for sound in unique_sounds:
+        sound_queue = st.session_state.get('sound_queue')
+        if sound_queue:
+            # Hidden autoplay tags start together, so play order doesn't matter; just drop duplicates
+            for sound in set(sound_queue):
                 audio_html = st.session_state.sound_engine.get_audio_html(sound)
                 if audio_html:
                     st.markdown(audio_html, unsafe_allow_html=True)
-            st.session_state.sound_queue = [] 
+            sound_queue.clear()
     except Exception as e:
         st.error(f"Failed to initialize bot: {e}")
         st.stop()
@@ -544,8 +760,7 @@ if page_nav == "Trading Dashboard":
                      st.toast(f"Switched to {selected_chain.upper()}")
                      st.rerun()
              else:
-                 exchanges = ['binance', 'coinbase', 'kraken', 'kucoin', 'bybit']
-                 selected_ex = st.selectbox("Exchange", exchanges, index=exchanges.index(exchange) if exchange in exchanges else 0)
+                 selected_ex = st.selectbox("Exchange", SUPPORTED_EXCHANGES, index=SUPPORTED_EXCHANGES.index(exchange) if exchange in SUPPORTED_EXCHANGES else 0)
                  if selected_ex != st.session_state.exchange:
                      st.session_state.exchange = selected_ex
                      st.rerun()
@@ -559,10 +774,7 @@ if page_nav == "Trading Dashboard":
             
             # Get current index
             curr_strat = bot.active_strategy.name if bot.active_strategy else strategy_options[0]
-            try:
-                idx = strategy_options.index(curr_strat)
-            except ValueError:
-                idx = 0
+            idx = strategy_options.index(curr_strat) if curr_strat in strategy_options else 0
                 
             selected_strategy = st.selectbox("Active Strategy", strategy_options, index=idx, key="strat_select_dash")
             
@@ -585,8 +797,7 @@ if page_nav == "Trading Dashboard":
                      # We don't force switch back here to allow UI to show "Live" but warn
                 else:
                      internal = 'DEX' if is_web3 and not is_cex else 'CEX_Direct'
-                     bot.set_trading_mode(internal)
-                     bot.risk_manager.set_mode(internal)
+                     apply_trading_mode(bot, internal)
                      st.session_state.trading_mode = 'Live'
                      
                      # Quick Sync
@@ -596,77 +807,61 @@ if page_nav == "Trading Dashboard":
                          # UI update will happen on rerun/refresh via risk_manager
                          pass
             else:
-                bot.set_trading_mode('Demo')
-                bot.risk_manager.set_mode('Demo')
+                apply_trading_mode(bot, 'Demo')
                 st.session_state.trading_mode = 'Demo'
                 
             if st.button("Refresh", use_container_width=True, key="refresh_dash_btn"):
                 st.rerun()
             
-    # Auto-Refresh Logic (Non-blocking check)
+    # --- METRICS ROW ---
     if 'auto_refresh' not in st.session_state:
         st.session_state.auto_refresh = False
-    
-    if st.session_state.auto_refresh:
-        time_now = time.time()
-        if 'last_refresh' not in st.session_state:
-            st.session_state.last_refresh = time_now
-        
-        if time_now - st.session_state.last_refresh > 60:
-            st.session_state.last_refresh = time_now
-            st.rerun()
-        else:
-            # Force a rerun after sleep to check again? No, that blocks.
-            # We rely on interaction or the user accepting manual refresh for now.
-            # To truly support auto-refresh, we'd need a component.
-            # For now, we'll just show the toggle state.
-            pass
 
-    # --- METRICS ROW ---
-    m1, m2, m3, m4 = st.columns(4)
-    with m1:
-        # Sync Button Integration
-        col_bal, col_sync = st.columns([3, 1])
-        with col_bal:
-            total_bal = bot.risk_manager.current_capital
-            metric_card("Total Balance", f"${total_bal:,.2f}", "+0.0%", "#00f2ff")
-        with col_sync:
-            st.markdown("<br>", unsafe_allow_html=True)
-            if st.button("🔄", help="Sync Balance", key="sync_bal_main"):
-                with st.spinner("Syncing..."):
-                    try:
-                        bot.sync_live_balance()
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Sync: {e}")
-    with m2:
-        metrics = st.session_state.user_manager.get_performance_metrics() if 'user_manager' in st.session_state else {}
-        pnl_total = metrics.get('total_pnl', 0.0)
-        metric_card("Total Profit", f"${pnl_total:,.2f}", None, "#00ff9d")
-    with m3:
-        win_rate = metrics.get('win_rate', 0.0)
-        metric_card("Win Rate", f"{win_rate:.1f}%", None, "#bd00ff")
-    with m4:
-        active_trades = len(bot.open_positions)
-        metric_card("Active Trades", f"{active_trades}", None, "#f59e0b")
+    # The metrics refresh on their own (every 60s with auto-refresh on) without re-running the chart
+    @st.fragment(run_every=60 if st.session_state.auto_refresh else None)
+    def render_dashboard_metrics():
+        m1, m2, m3, m4 = st.columns(4)
+        with m1:
+            # Sync Button Integration
+            col_bal, col_sync = st.columns([3, 1])
+            with col_bal:
+                total_bal = bot.risk_manager.current_capital
+                metric_card("Total Balance", f"${total_bal:,.2f}", "+0.0%", "#00f2ff")
+            with col_sync:
+                st.markdown("<br>", unsafe_allow_html=True)
+                if st.button("🔄", help="Sync Balance", key="sync_bal_main"):
+                    with st.spinner("Syncing..."):
+                        try:
+                            bot.sync_live_balance()
+                            st.rerun(scope="fragment")
+                        except Exception as e:
+                            _handle_sync_error(exchange, e)
+        with m2:
+            metrics = st.session_state.user_manager.get_performance_metrics() if 'user_manager' in st.session_state else {}
+            pnl_total = metrics.get('total_pnl', 0.0)
+            metric_card("Total Profit", f"${pnl_total:,.2f}", None, "#00ff9d")
+        with m3:
+            win_rate = metrics.get('win_rate', 0.0)
+            metric_card("Win Rate", f"{win_rate:.1f}%", None, "#bd00ff")
+        with m4:
+            active_trades = len(bot.open_positions)
+            metric_card("Active Trades", f"{active_trades}", None, "#f59e0b")
+
+    render_dashboard_metrics()
 
     st.markdown("<div style='margin-bottom: 20px;'></div>", unsafe_allow_html=True)
 
     # --- MAIN GRID LAYOUT ---
     col_chart, col_actions = st.columns([3, 1])
     
-    with st.spinner("Fetching Market Data..."):
-        raw_df = get_cached_ohlcv(bot, symbol, timeframe)
-        
     with col_chart:
         # --- CHART SECTION ---
         pair = symbol.replace("/", "").upper()
         tv_symbol = f"BINANCE:{pair}"
-        tv_interval_map = {'30s': '1', '1m': '1', '3m': '3', '5m': '5', '15m': '15', '30m': '30', '1h': '60', '2h': '120', '4h': '240', '6h': '360', '12h': '720', '1d': 'D'}
-        tv_interval = tv_interval_map.get(timeframe, '60')
+        tv_interval = TV_INTERVAL_MAP.get(timeframe, '60')
         
-        html_code = f'<div class="tradingview-widget-container" style="height:600px;width:100%"><div class="tradingview-widget-container__widget" style="height:calc(100% - 32px);width:100%"></div><script type="text/javascript" src="https://s3.tradingview.com/external-embedding/embed-widget-advanced-chart.js" async>{{"autosize": true, "symbol": "{tv_symbol}", "interval": "{tv_interval}", "timezone": "Etc/UTC", "theme": "dark", "style": "1", "locale": "en", "enable_publishing": false, "allow_symbol_change": true, "support_host": "https://www.tradingview.com"}}</script></div>'
-        components.html(html_code, height=600)
+        # Same (symbol, interval) -> identical HTML, so the frontend keeps the loaded iframe
+        components.html(build_tv_widget_html(tv_symbol, tv_interval), height=600)
         
     with col_actions:
         # --- QUICK ACTIONS & MANUAL TRADE ---
@@ -740,7 +935,7 @@ if page_nav == "Trading Dashboard":
                                         import pandas_ta as ta
                                         df.ta.atr(length=14, append=True)
                                         atr = df['ATRr_14'].iloc[-1] if 'ATRr_14' in df else (df['high'] - df['low']).mean()
-                                except:
+                                except Exception:
                                     pass
                                 
                                 # Use Place method which attaches SL/TP
@@ -752,16 +947,7 @@ if page_nav == "Trading Dashboard":
                         time.sleep(1)
                         st.rerun()
                     except Exception as e:
-                        err_msg = str(e)
-                        # Handle Tenacity RetryError to show actual cause
-                        if "RetryError" in type(e).__name__:
-                            try:
-                                if hasattr(e, 'last_attempt'):
-                                    attempt = e.last_attempt
-                                    if attempt and attempt.exception():
-                                        err_msg = str(attempt.exception())
-                            except:
-                                pass
+                        err_msg = describe_error(e)
                         st.error(f"Failed: {err_msg}")
         
         st.divider()
@@ -772,16 +958,7 @@ if page_nav == "Trading Dashboard":
                  time.sleep(1)
                  st.rerun()
              except Exception as e:
-                 err_msg = str(e)
-                 # Handle Tenacity RetryError to show actual cause
-                 if "RetryError" in type(e).__name__:
-                     try:
-                         if hasattr(e, 'last_attempt'):
-                             attempt = e.last_attempt
-                             if attempt and attempt.exception():
-                                 err_msg = str(attempt.exception())
-                     except:
-                         pass
+                 err_msg = describe_error(e)
                  st.error(f"Flatten Failed: {err_msg}")
 
     # --- BOTTOM SECTION (Trade History) ---
@@ -837,53 +1014,17 @@ if page_nav == "Trading Dashboard":
                             time.sleep(0.5)
                             st.rerun()
                         except Exception as e:
-                            err_msg = str(e)
-                            # Handle Tenacity RetryError to show actual cause
-                            if "RetryError" in type(e).__name__:
-                                try:
-                                    if hasattr(e, 'last_attempt'):
-                                        attempt = e.last_attempt
-                                        if attempt and attempt.exception():
-                                            err_msg = str(attempt.exception())
-                                except:
-                                    pass
+                            err_msg = describe_error(e)
                             st.error(f"Close Failed: {err_msg}")
         else:
             st.info("No active positions.")
             
     with tab_hist:
-        # Load trade history from log file
-        log_file = "trade_log.json"
-        history_data = []
-        if os.path.exists(log_file):
-            try:
-                with open(log_file, "r") as f:
-                    history_data = json.load(f)
-            except:
-                pass
+        # Load trade history from log file (re-parsed only when the file changes)
+        log_file = TRADE_LOG_FILE
+        df_hist = get_trade_history(log_file)
         
-        if history_data:
-            # Create DataFrame with specific columns
-            # Ensure we map the data correctly to: Time, Side, Symbol, Qty, Entry, Exit, PnL, Reason
-            
-            # Normalize data structure if needed
-            flat_data = []
-            for t in history_data:
-                # Handle different formats if log structure varies
-                entry = {
-                    "Time": t.get("timestamp", t.get("time", "")),
-                    "Side": t.get("side", "").upper(),
-                    "Symbol": t.get("symbol", ""),
-                    "Qty": t.get("amount", 0),
-                    "Entry": t.get("price", t.get("entry_price", 0)),
-                    "Exit": t.get("exit_price", "-"),
-                    "PnL": t.get("pnl", "-"),
-                    "Reason": t.get("strategy", t.get("reason", "Manual"))
-                }
-                flat_data.append(entry)
-                
-            df_hist = pd.DataFrame(flat_data)
-            
+        if df_hist is not None and not df_hist.empty:
             # Display
             st.dataframe(df_hist, use_container_width=True)
             
@@ -902,10 +1043,14 @@ if page_nav == "Trading Dashboard":
     # --- ASSISTANT SECTION (Moved to bottom) ---
     st.divider()
     neon_header("Capa-X Assistant", level=3)
-    user_query = st.text_input("Command Interface", placeholder="Ask Capa-X...")
-    if user_query and 'nlp_engine' in st.session_state:
-        response = st.session_state.nlp_engine.process_query(user_query, st.session_state.user_manager)
-        st.markdown(f"**> {response}**")
+    # A form so the query runs once on submit, not again on every later rerun of the page
+    with st.form("nlp_form", clear_on_submit=True):
+        user_query = st.text_input("Command Interface", placeholder="Ask Capa-X...")
+        submitted = st.form_submit_button("Ask")
+    if submitted and user_query and 'nlp_engine' in st.session_state:
+        st.session_state.nlp_response = st.session_state.nlp_engine.process_query(user_query, st.session_state.user_manager)
+    if st.session_state.get('nlp_response'):
+        st.markdown(f"**> {st.session_state.nlp_response}**")
 
 
 # 4. AI MARKET ANALYZER
@@ -986,14 +1131,17 @@ elif page_nav == "AI Market Analyzer":
             with kf3:
                 metric_card("ADX", f"{feats.get('adx', 0):.2f}")
 
-            # Chart
-            import plotly.graph_objects as go
-            fig = go.Figure(data=[go.Candlestick(x=df.index,
-                    open=df['open'],
-                    high=df['high'],
-                    low=df['low'],
-                    close=df['close'])])
-            fig.update_layout(title=f"{res['symbol']} Price Action", template="plotly_dark", height=400)
+            # Chart (built once per analysis result; unrelated reruns reuse it)
+            fig = res.get('figure')
+            if fig is None:
+                import plotly.graph_objects as go
+                fig = go.Figure(data=[go.Candlestick(x=df.index,
+                        open=df['open'],
+                        high=df['high'],
+                        low=df['low'],
+                        close=df['close'])])
+                fig.update_layout(title=f"{res['symbol']} Price Action", template="plotly_dark", height=400)
+                res['figure'] = fig
             st.plotly_chart(fig, use_container_width=True)
             
         else:
@@ -1051,17 +1199,18 @@ elif page_nav == "Strategy Intelligence":
                  
                  # Quick Sync
                  if is_web3:
-                     w3_bal = st.session_state.web3_wallet.get_balance()
+                     w3 = st.session_state.web3_wallet
+                     w3_bal = get_cached_wallet_balance(w3, w3.address, w3.chain_id)
                      st.session_state.web3_balance = w3_bal
                      # Estimate USD
-                     chain_id = st.session_state.web3_wallet.chain_id
+                     chain_id = w3.chain_id
                      usd_price = 0.0
                      # Try fetch real price
                      try:
-                         sym = st.session_state.web3_wallet.CHAINS.get(chain_id, {}).get('symbol', 'ETH')
-                         p = bot.data_manager.get_current_price(f"{sym}/USDT")
+                         sym = w3.get_symbol()
+                         p = get_cached_price(bot, f"{sym}/USDT")
                          if p: usd_price = p
-                     except:
+                     except Exception:
                          pass
                      bot.risk_manager.update_live_balance(w3_bal * usd_price)
                  st.rerun()
@@ -1091,7 +1240,7 @@ elif page_nav == "Strategy Intelligence":
     neon_header("🤖 Auto-Pilot Control System", level=2)
     
     if 'auto_trader' not in st.session_state:
-        st.session_state.auto_trader = AutoTrader(bot)
+        st.session_state.auto_trader = lazy_class('AutoTrader')(bot)
     at = st.session_state.auto_trader
     
     # --- Integration: User Inputs for Auto-Bot ---
@@ -1177,6 +1326,7 @@ elif page_nav == "Strategy Intelligence":
 elif page_nav == "Manual Trading":
     neon_header("🛠️ Pro Trading Terminal")
     bot = get_bot(exchange)
+    rm = bot.risk_manager # lazy property on the bot; resolve it once for the page
     
     # --- Styles for the Terminal ---
     st.markdown('<style>.big-metric { font-size: 24px; font-weight: bold; color: #00f2ff; } .price-metric { font-size: 24px; font-weight: bold; color: #00ff9d; } .terminal-label { font-size: 12px; color: #888; margin-bottom: 2px; } .stButton>button { width: 100%; border-radius: 4px; } .buy-btn>button { background-color: #00bd55; color: white; border: none; height: 45px; font-size: 16px; font-weight: bold; } .sell-btn>button { background-color: #ff3b3b; color: white; border: none; height: 45px; font-size: 16px; font-weight: bold; } .preset-btn>button { padding: 0px; font-size: 10px; height: 25px; }</style>', unsafe_allow_html=True)
@@ -1205,27 +1355,23 @@ elif page_nav == "Manual Trading":
                      # Force back to Demo visually if possible, or just don't switch internal mode
                  else:
                      internal_mode = 'DEX' if is_web3 and not is_cex else 'CEX_Direct'
-                     bot.set_trading_mode(internal_mode)
-                     bot.risk_manager.set_mode(internal_mode)
+                     apply_trading_mode(bot, internal_mode)
                      st.session_state.trading_mode = 'Live'
                      
                      # Auto-Sync on Switch
                      if is_web3:
-                         w3_bal = st.session_state.web3_wallet.get_balance()
+                         w3 = st.session_state.web3_wallet
+                         w3_bal = get_cached_wallet_balance(w3, w3.address, w3.chain_id)
                          st.session_state.web3_balance = w3_bal
                          # Estimate USD
-                         chain_id = st.session_state.web3_wallet.chain_id
-                         usd_price = 1.0
-                         if str(chain_id) in ['ton', 'ton-mainnet']: usd_price = 5.40
-                         elif str(chain_id) in ['solana', 'solana-mainnet']: usd_price = 145.20
-                         elif str(chain_id) in ['1', 'ethereum']: usd_price = 2600.0
+                         chain_id = w3.chain_id
+                         usd_price = WEB3_SWITCH_USD_PRICES.get(str(chain_id), 1.0)
                          
                          capital_usd = w3_bal * usd_price
-                         bot.risk_manager.update_live_balance(capital_usd)
+                         rm.update_live_balance(capital_usd)
                          
              else:
-                 bot.set_trading_mode('Demo')
-                 bot.risk_manager.set_mode('Demo')
+                 apply_trading_mode(bot, 'Demo')
                  st.session_state.trading_mode = 'Demo'
 
         # --- Auto-Sync Web3 Balance (Continuous) ---
@@ -1242,42 +1388,39 @@ elif page_nav == "Manual Trading":
              if wallet_obj.address != wallet_obj.address.strip():
                  wallet_obj.address = wallet_obj.address.strip()
              
-             # Always fetch balance from wallet
-             w3_bal = wallet_obj.get_balance()
+             # Fetch balance from wallet (shared with the mode toggle above for this rerun)
+             w3_bal = get_cached_wallet_balance(wallet_obj, wallet_obj.address, wallet_obj.chain_id)
              st.session_state.web3_balance = w3_bal
              
              # Estimate USD Value
              chain_id = str(wallet_obj.chain_id)
-             usd_price = 1.0
-             if chain_id in ['ton', 'ton-mainnet']: usd_price = 5.40
-             elif chain_id in ['solana', 'solana-mainnet']: usd_price = 145.20
-             elif chain_id in ['1', 'ethereum']: usd_price = 2600.0
-             elif chain_id in ['56', 'bsc']: usd_price = 600.0
+             usd_price = WEB3_SYNC_USD_PRICES.get(chain_id, 1.0)
              
              capital_usd = w3_bal * usd_price
              
-             # Update Bot Capital if different
-             if abs(bot.risk_manager.current_capital - capital_usd) > 0.001:
-                 bot.risk_manager.update_live_balance(capital_usd)
-                 if 'balance_synced' not in st.session_state:
-                     st.session_state.balance_synced = True
-                     st.rerun()
+             # Update Bot Capital if different (read below in this same run, so no rerun needed)
+             if abs(rm.current_capital - capital_usd) > 0.001:
+                 rm.update_live_balance(capital_usd)
 
         # --- CEX Balance Sync (Added for Live Trading) ---
         elif st.session_state.get('trading_mode') == 'Live' and not is_web3_mode:
-             # Periodically sync CEX balance
-             if 'last_cex_sync' not in st.session_state or (time.time() - st.session_state.last_cex_sync > 15):
-                 bot.sync_live_balance()
-                 st.session_state.last_cex_sync = time.time()
-                 st.rerun()
-        
-        bal = bot.risk_manager.current_capital
+             # Periodically sync CEX balance (per exchange; stamped before the call so failures don't retry every rerun)
+             sync_key = f"{exchange}_last_cex_sync"
+             now = time.monotonic()
+             if now - st.session_state.get(sync_key, float('-inf')) > CEX_SYNC_INTERVAL:
+                 st.session_state[sync_key] = now
+                 try:
+                     bot.sync_live_balance()
+                 except Exception as e:
+                     _handle_sync_error(exchange, e, report=st.caption)
+        
+        bal = rm.current_capital
         
         # Display Logic
         if st.session_state.get('trading_mode') == 'Live' and bal == 0.0:
             st.markdown(f'<div class="big-metric" style="color: #ff3b3b;">$0.00 (Syncing...)</div>', unsafe_allow_html=True)
             if st.button("Force Sync", key="force_sync_btn_man"):
-                 bot.risk_manager.update_live_balance(capital_usd) # Use calculated value
+                 rm.update_live_balance(capital_usd) # Use calculated value
                  st.rerun()
         else:
             st.markdown(f'<div class="big-metric">${bal:,.2f}</div>', unsafe_allow_html=True)
@@ -1295,7 +1438,7 @@ elif page_nav == "Manual Trading":
     st.markdown("<br>", unsafe_allow_html=True)
     with st.expander("🤖 Auto-Trading Pilot (Real-Time)", expanded=True):
         if 'auto_trader' not in st.session_state:
-            st.session_state.auto_trader = AutoTrader(bot)
+            st.session_state.auto_trader = lazy_class('AutoTrader')(bot)
         at_man = st.session_state.auto_trader
         
         c_at1, c_at2 = st.columns([1, 2])
@@ -1450,16 +1593,7 @@ elif page_nav == "Manual Trading":
                          time.sleep(1)
                          st.rerun()
                      except Exception as e:
-                        err_msg = str(e)
-                        # Handle Tenacity RetryError to show actual cause
-                        if "RetryError" in type(e).__name__:
-                            try:
-                                if hasattr(e, 'last_attempt'):
-                                    attempt = e.last_attempt
-                                    if attempt and attempt.exception():
-                                        err_msg = str(attempt.exception())
-                            except:
-                                pass
+                        err_msg = describe_error(e)
                         st.error(f"Execution Failed: {err_msg}")
                  else:
                      st.error("Invalid Amount")
@@ -1491,16 +1625,7 @@ elif page_nav == "Manual Trading":
                          time.sleep(1)
                          st.rerun()
                      except Exception as e:
-                        err_msg = str(e)
-                        # Handle Tenacity RetryError to show actual cause
-                        if "RetryError" in type(e).__name__:
-                            try:
-                                if hasattr(e, 'last_attempt'):
-                                    attempt = e.last_attempt
-                                    if attempt and attempt.exception():
-                                        err_msg = str(attempt.exception())
-                            except:
-                                pass
+                        err_msg = describe_error(e)
                         st.error(f"Execution Failed: {err_msg}")
                  else:
                      st.error("Invalid Amount")
@@ -1515,8 +1640,8 @@ elif page_nav == "Manual Trading":
                 if st.button("↺ Reset Demo"):
                      # Reset logic
                      new_bal = st.session_state.get('demo_reset_val', 1000.0)
-                     bot.risk_manager.demo_balance = new_bal
-                     bot.risk_manager.metrics['Demo']['peak'] = new_bal
+                     rm.demo_balance = new_bal
+                     rm.metrics['Demo']['peak'] = new_bal
                      st.success("Demo Reset!")
                      st.rerun()
             with c_sub2:
@@ -1530,21 +1655,12 @@ elif page_nav == "Manual Trading":
                     time.sleep(1)
                     st.rerun()
                 except Exception as e:
-                    err_msg = str(e)
-                    # Handle Tenacity RetryError to show actual cause
-                    if "RetryError" in type(e).__name__:
-                        try:
-                            if hasattr(e, 'last_attempt'):
-                                attempt = e.last_attempt
-                                if attempt and attempt.exception():
-                                    err_msg = str(attempt.exception())
-                        except:
-                            pass
+                    err_msg = describe_error(e)
                     st.error(f"Error flattening positions: {err_msg}")
 
     # --- Active Positions Table ---
     st.subheader("Active Positions")
-    if bot.risk_manager.open_positions:
+    if rm.open_positions:
         # Header
         h1, h2, h3, h4, h5, h6, h7 = st.columns([1.5, 0.8, 1, 1, 1, 1, 1.2])
         h1.markdown("**Symbol**")
@@ -1557,24 +1673,30 @@ elif page_nav == "Manual Trading":
         
         st.divider()
         
+        positions = rm.open_positions
+        symbols = [p.get('symbol', 'UNKNOWN') for p in positions]
+        sides = [p.get('side', p.get('type', 'buy')).upper() for p in positions]
+        
+        # Fetch every position's ticker in one concurrent batch
+        tickers = get_cached_tickers(bot, exchange, tuple(sorted(set(symbols))))
+        
+        # PnL for all positions in one vectorized pass (missing ticker -> mark at entry)
+        amounts = np.array([float(p.get('amount', p.get('position_size', 0))) for p in positions], dtype=np.float64)
+        entries = np.array([float(p.get('entry_price', p.get('entry', 0))) for p in positions], dtype=np.float64)
+        marks = np.array([(tickers.get(sym) or {}).get('last') for sym in symbols], dtype=np.float64)
+        marks = np.where(np.isnan(marks), entries, marks)
+        moves = np.where(np.isin(sides, ('BUY', 'LONG')), marks - entries, entries - marks)
+        pnl_vals = moves * amounts
+        pnl_pcts = np.divide(moves, entries, out=np.zeros_like(moves), where=entries != 0) * 100
+        
         # Iterate Positions
-        for i, p in enumerate(bot.risk_manager.open_positions):
-            symbol = p.get('symbol', 'UNKNOWN')
-            side = p.get('side', p.get('type', 'buy')).upper()
-            amount = float(p.get('amount', p.get('position_size', 0)))
-            entry_price = float(p.get('entry_price', p.get('entry', 0)))
-            
-            # Current Price
-            ticker = get_cached_ticker(bot, symbol)
-            current_p = ticker.get('last', entry_price) if ticker else entry_price
-            
-            # Calc PnL
-            if side in ['BUY', 'LONG']:
-                pnl_val = (current_p - entry_price) * amount
-                pnl_pct = ((current_p - entry_price) / entry_price) * 100
-            else:
-                pnl_val = (entry_price - current_p) * amount
-                pnl_pct = ((entry_price - current_p) / entry_price) * 100
+        for i, p in enumerate(positions):
+            symbol = symbols[i]
+            side = sides[i]
+            amount = amounts[i]
+            entry_price = entries[i]
+            pnl_val = pnl_vals[i]
+            pnl_pct = pnl_pcts[i]
             
             pnl_color = "green" if pnl_val >= 0 else "red"
             
@@ -1628,35 +1750,12 @@ elif page_nav == "Manual Trading":
     # --- Trade History (Existing) ---
     st.divider()
     st.subheader("Trade History")
-    log_file = "trade_log.json"
-    if os.path.exists(log_file):
-        with open(log_file, "r") as f:
-            try:
-                history = json.load(f)
-            except:
-                history = []
-        
-        if history:
+    log_file = TRADE_LOG_FILE
+    df_hist = get_trade_history(log_file)
+    if df_hist is not None:
+        if not df_hist.empty:
             # Reverse to show newest first
-            history = history[::-1]
-            
-            # Flatten/Normalize
-            flat_data = []
-            for t in history:
-                # Handle different formats if log structure varies
-                entry = {
-                    "Time": t.get("timestamp", t.get("time", "")),
-                    "Side": t.get("side", "").upper(),
-                    "Symbol": t.get("symbol", ""),
-                    "Qty": t.get("amount", 0),
-                    "Entry": t.get("price", t.get("entry_price", 0)),
-                    "Exit": t.get("exit_price", "-"),
-                    "PnL": t.get("pnl", "-"),
-                    "Reason": t.get("strategy", t.get("reason", "Manual"))
-                }
-                flat_data.append(entry)
-            
-            df_hist = pd.DataFrame(flat_data)
+            df_hist = df_hist.iloc[::-1].reset_index(drop=True)
             st.dataframe(df_hist, use_container_width=True)
             
             c_h1, c_h2 = st.columns([1, 4])
@@ -1689,11 +1788,9 @@ elif page_nav == "Wallet & Execution":
         
         # Active Exchange
         st.markdown("**Active Exchange**")
-        exchanges = ['binance', 'coinbase', 'kraken', 'kucoin', 'bybit', 'okx']
-        current_ex = st.session_state.get('exchange', 'binance')
-        selected_ex = st.selectbox("Active Exchange", exchanges, index=exchanges.index(current_ex) if current_ex in exchanges else 0, label_visibility="collapsed")
+        selected_ex = st.selectbox("Active Exchange", SUPPORTED_EXCHANGES, index=SUPPORTED_EXCHANGES.index(exchange) if exchange in SUPPORTED_EXCHANGES else 0, label_visibility="collapsed")
         
-        if selected_ex != st.session_state.exchange:
+        if selected_ex != exchange:
             st.session_state.exchange = selected_ex
             st.rerun()
             
@@ -1736,10 +1833,9 @@ elif page_nav == "Wallet & Execution":
         internal_mode = 'Demo'
 
     try:
-        bot.set_trading_mode(internal_mode)
-        bot.risk_manager.set_mode(internal_mode) # Ensure Risk Manager knows the mode
+        apply_trading_mode(bot, internal_mode)
         st.session_state.trading_mode = ui_mode
-    except:
+    except Exception:
         pass
 
     if ui_mode == 'Live':
@@ -1749,85 +1845,83 @@ elif page_nav == "Wallet & Execution":
         
     st.divider()
     
-    # Wallet Sync
-    if st.button("🔄 Sync Balance", use_container_width=True):
-        with st.spinner("Syncing..."):
-            try:
-                # 1. Sync CEX
-                if is_cex_connected:
-                    bot.sync_live_balance()
+    # Sync + balances rerun on their own so the sync button doesn't re-execute the whole page
+    @st.fragment
+    def render_wallet_balances():
+        # Wallet Sync
+        if st.button("🔄 Sync Balance", use_container_width=True):
+            with st.spinner("Syncing..."):
+                try:
+                    # 1. Sync CEX
+                    if is_cex_connected:
+                        bot.sync_live_balance()
                 
-                # 2. Sync Web3
-                if is_web3_connected:
-                    w3_bal = st.session_state.web3_wallet.get_balance()
-                    st.session_state.web3_balance = w3_bal
+                    # 2. Sync Web3
+                    if is_web3_connected:
+                        w3_bal = st.session_state.web3_wallet.get_balance()
+                        st.session_state.web3_balance = w3_bal
                     
-                    # Estimate USD
-                    chain_id = st.session_state.web3_wallet.chain_id
-                    usd_price = 0.0
+                        # Estimate USD
+                        chain_id = st.session_state.web3_wallet.chain_id
+                        usd_price = 0.0
                     
-                    # Map Chain to Symbol
-                    symbol_map = {
-                        'bitcoin': 'BTC',
-                        'litecoin': 'LTC',
-                        'dogecoin': 'DOGE',
-                        'tron': 'TRX',
-                        'solana': 'SOL',
-                        'cosmos': 'ATOM',
-                        'ton': 'TON',
-                        '1': 'ETH',
-                        'ethereum': 'ETH',
-                        '56': 'BNB',
-                        '137': 'MATIC',
-                        '43114': 'AVAX',
-                        '250': 'FTM',
-                        '10': 'OP',
-                        '42161': 'ETH'
-                    }
-                    
-                    symbol = symbol_map.get(str(chain_id), 'ETH')
+                        # Map Chain to Symbol
+                        symbol = CHAIN_NATIVE_SYMBOLS.get(str(chain_id), 'ETH')
                     
-                    # Try fetching live price
-                    try:
-                        price = get_cached_price(bot, f"{symbol}/USDT")
-                        if price:
-                            usd_price = price
-                        else:
-                            # Fallback Prices (Approximate)
-                            fallbacks = {
-                                'BTC': 95000.0, 'ETH': 2700.0, 'SOL': 150.0, 'BNB': 600.0,
-                                'TON': 5.5, 'TRX': 0.16, 'LTC': 70.0, 'DOGE': 0.12, 'ATOM': 6.0,
-                                'MATIC': 0.40, 'AVAX': 25.0, 'FTM': 0.60, 'OP': 1.50
-                            }
-                            usd_price = fallbacks.get(symbol, 0.0)
-                    except:
-                        pass
+                        # Try fetching live price
+                        try:
+                            price = get_cached_price(bot, f"{symbol}/USDT")
+                            if price:
+                                usd_price = price
+                            else:
+                                # Fallback Prices (Approximate)
+                                usd_price = FALLBACK_USD_PRICES.get(symbol, 0.0)
+                        except Exception:
+                            pass
                     
-                    capital_usd = w3_bal * usd_price
-                    bot.risk_manager.update_live_balance(capital_usd)
-                    st.success(f"Synced Web3 Balance: ${capital_usd:,.2f}")
+                        capital_usd = w3_bal * usd_price
+                        bot.risk_manager.update_live_balance(capital_usd)
+                        st.success(f"Synced Web3 Balance: ${capital_usd:,.2f}")
 
-                st.session_state[f"wallet_cache_{exchange}_v10"] = bot.wallet_balances
-                st.rerun()
-            except Exception as e:
-                st.error(f"Sync failed: {e}")
+                    st.session_state[f"wallet_cache_{exchange}_v10"] = bot.wallet_balances
+                    st.rerun(scope="fragment")
+                except Exception as e:
+                    _handle_sync_error(exchange, e)
 
-    # Metrics
-    total_usdt = bot.risk_manager.current_capital
-    metric_card("Total Equity", f"${total_usdt:,.2f}", color="#00f2ff")
+        # Metrics
+        total_usdt = bot.risk_manager.current_capital
+        metric_card("Total Equity", f"${total_usdt:,.2f}", color="#00f2ff")
     
-    if hasattr(bot, 'wallet_balances') and bot.wallet_balances:
-        # Display Gas Fees if available
-        if hasattr(bot, 'latest_gas_fees') and bot.latest_gas_fees:
-            gf = bot.latest_gas_fees
-            st.info(f"⛽ Gas Fees ({gf.get('type','Standard')}): {gf.get('estimated_cost_gwei',0)} {gf.get('unit','Gwei')}")
-            
-        df = pd.DataFrame(bot.wallet_balances)
-        st.dataframe(df, use_container_width=True)
-    else:
-        st.info("No assets found.")
-        if is_cex_connected:
-             st.caption("Tip: If you have funds, ensure your API Key has 'Spot' or 'Unified' permissions.")
+        if hasattr(bot, 'wallet_balances') and bot.wallet_balances:
+            # Display Gas Fees if available
+            if hasattr(bot, 'latest_gas_fees') and bot.latest_gas_fees:
+                gf = bot.latest_gas_fees
+                st.info(f"⛽ Gas Fees ({gf.get('type','Standard')}): {gf.get('estimated_cost_gwei',0)} {gf.get('unit','Gwei')}")
+            
+            # Rebuild the table only when the bot's wallet_balances version changes
+            df_key = f"wallet_df_{exchange}"
+            df_sig = bot.wallet_balances_sig()
+            cached = st.session_state.get(df_key)
+            if cached and cached[0] == df_sig:
+                asset_table = cached[1]
+            else:
+                # Columnar numpy view -> DataFrame without per-row dict unpacking;
+                # same columns and row order as pd.DataFrame(bot.wallet_balances)
+                df = pd.DataFrame(bot.wallet_balance_columns())
+                try:
+                    # Keep it as Arrow so reruns skip the pandas -> Arrow conversion st.dataframe would do
+                    asset_table = pa.Table.from_pandas(df)
+                except pa.ArrowException:
+                    # Mixed-type object columns: let st.dataframe apply its own conversion
+                    asset_table = df
+                st.session_state[df_key] = (df_sig, asset_table)
+            st.dataframe(asset_table, use_container_width=True)
+        else:
+            st.info("No assets found.")
+            if is_cex_connected:
+                 st.caption("Tip: If you have funds, ensure your API Key has 'Spot' or 'Unified' permissions.")
+
+    render_wallet_balances()
 
     # --- ASSET MANAGEMENT ---
     st.divider()
@@ -1836,7 +1930,7 @@ elif page_nav == "Wallet & Execution":
     # Initialize DeFi Manager
     if 'defi_manager' not in st.session_state or not hasattr(st.session_state.defi_manager, 'get_deposit_address'):
         pk = os.getenv("WALLET_PRIVATE_KEY")
-        st.session_state.defi_manager = DeFiManager()
+        st.session_state.defi_manager = lazy_class('DeFiManager')(ton_manager=get_ton_manager())
         if pk:
             try:
                 st.session_state.defi_manager.load_private_key(pk)
@@ -1864,7 +1958,7 @@ elif page_nav == "Wallet & Execution":
             st.rerun()
 
     # Network Selection
-    chains = list(DeFiManager.CHAINS.keys())
+    chains = list(lazy_class('DeFiManager').CHAINS.keys())
     current_chain = st.session_state.defi_manager.current_chain if hasattr(st.session_state.defi_manager, 'current_chain') else 'ethereum'
     selected_chain = st.selectbox("Active Network", chains, index=chains.index(current_chain) if current_chain in chains else 0)
     if selected_chain != current_chain:
@@ -1926,7 +2020,7 @@ elif page_nav == "Wallet & Execution":
                     to = st.text_input("Recipient Address (0x...)", key="native_to")
                     amt = st.number_input("Amount (native token)", min_value=0.0, step=0.0001, key="native_amt")
                     if st.session_state.defi_manager.current_chain != 'ton':
-                        gas_params = st.session_state.defi_manager.estimate_gas_params(nc)
+                        gas_params = get_cached_gas_params(st.session_state.defi_manager, nc, st.session_state.defi_manager.current_chain)
                         if "gasPrice" in gas_params:
                             st.caption(f"Legacy gas price: {st.session_state.defi_manager.w3.from_wei(gas_params['gasPrice'], 'gwei')} gwei")
                         else:
@@ -1987,13 +2081,14 @@ elif page_nav == "Wallet & Execution":
             token_list = st.text_area("Enter token addresses (one per line)", value="", placeholder=placeholder_text)
             if st.button("Check Token Balances"):
                 if token_list.strip():
-                    for line in token_list.strip().splitlines():
-                        addr = line.strip()
-                        try:
-                            bal = st.session_state.defi_manager.erc20_balance(nc, addr)
-                            st.write(f"{addr}: {bal}")
-                        except Exception as e:
-                            st.write(f"{addr}: error {e}")
+                    addrs = [line.strip() for line in token_list.strip().splitlines() if line.strip()]
+                    try:
+                        # One batched call for all tokens instead of two RPCs per token
+                        bals = st.session_state.defi_manager.erc20_balances(nc, addrs)
+                        for addr, bal in zip(addrs, bals):
+                            st.write(f"{addr}: {bal}" if bal is not None else f"{addr}: error (balanceOf/decimals call failed)")
+                    except Exception as e:
+                        st.write(f"{', '.join(addrs)}: error {e}")
                 else:
                     st.info("Add token addresses to check balances.")
 
@@ -2031,9 +2126,7 @@ elif page_nav == "Wallet & Execution":
         st.markdown("#### Import New Wallet")
         with st.form("import_wallet_form"):
             new_pk = st.text_input("Private Key", type="password", placeholder="0x... or Base58...")
-            chain_options = ['1', '56', '137', 'solana', 'ton', 'bitcoin']
-            chain_labels = ['Ethereum', 'BNB Chain', 'Polygon', 'Solana', 'TON', 'Bitcoin']
-            chain_idx = st.selectbox("Network", options=chain_options, format_func=lambda x: chain_labels[chain_options.index(x)])
+            chain_idx = st.selectbox("Network", options=tuple(IMPORT_WALLET_NETWORKS), format_func=IMPORT_WALLET_NETWORKS.get)
             
             submitted = st.form_submit_button("Import & Encrypt")
             if submitted:
@@ -2057,12 +2150,10 @@ elif page_nav == "Wallet & Execution":
         st.markdown("### Exchange API Keys")
         st.info("API Keys are encrypted locally. Enable 'Spot Trading' permission.")
         
-        exchanges = ['binance', 'coinbase', 'kraken', 'kucoin', 'bybit']
-        selected_ex = st.selectbox("Select Exchange", exchanges)
+        selected_ex = st.selectbox("Select Exchange", SUPPORTED_EXCHANGES)
         
-        # Check if exists
-        curr_key, curr_secret = st.session_state.auth_manager.get_api_keys(st.session_state.username, selected_ex)
-        if curr_key:
+        # Check if exists (presence only; no need to decrypt on every rerun)
+        if st.session_state.auth_manager.has_api_keys(st.session_state.username, selected_ex):
             st.success(f"✅ Credentials found for {selected_ex.title()}")
             if st.button("Delete Credentials"):
                 st.session_state.auth_manager.delete_api_keys(st.session_state.username, selected_ex)
@@ -2110,9 +2201,12 @@ elif page_nav == "Wallet & Execution":
         else:
             st.markdown("#### Exchange Deposit")
             st.info("To add funds to your Exchange account, please visit the exchange directly.")
-            st.markdown(f"**Current Exchange:** {st.session_state.exchange.title()}")
-            st.markdown("[Open Binance](https://www.binance.com/en/my/wallet/account/main/deposit)")
-            st.markdown("[Open Coinbase](https://www.coinbase.com/)")
+            st.markdown(f"**Current Exchange:** {exchange.title()}")
+            dep_url = EXCHANGE_DEPOSIT_URLS.get(exchange)
+            if dep_url:
+                st.markdown(f"[Open {exchange.title()}]({dep_url})")
+            else:
+                st.markdown(" · ".join(f"[Open {ex.title()}]({url})" for ex, url in EXCHANGE_DEPOSIT_URLS.items()))
 
 
 # 5. PERFORMANCE ANALYTICS
@@ -2129,7 +2223,7 @@ elif page_nav == "Performance Analytics":
         st.subheader("Trade History")
         # Trade History Table from Local DB
         try:
-            bot = get_bot(st.session_state.exchange)
+            bot = get_bot(exchange)
             if hasattr(bot, 'storage'):
                 trades_df = bot.storage.get_trades(limit=50)
                 if not trades_df.empty:
@@ -2144,9 +2238,7 @@ elif page_nav == "Performance Analytics":
 # 5. SYSTEM TARGETS
 elif page_nav == "System Targets":
     neon_header("System Targets", level=2)
-    target_min = TRADING_CONFIG['objectives']['target_apr_min'] * 100
-    target_max = TRADING_CONFIG['objectives']['target_apr_max'] * 100
-    metric_card("Target APR", f"{target_min:.0f}% - {target_max:.0f}%", color="#bd00ff")
+    metric_card("Target APR", TARGET_APR_LABEL, color="#bd00ff")
 
 # 6. WEB3 INTEGRATION
 elif page_nav == "Web3 Integration":
@@ -2263,13 +2355,13 @@ elif page_nav == "Web3 Integration":
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Exchange Connection Section
-    st.markdown('<div style="background: linear-gradient(90deg, #10b981, #059669); padding: 10px; border-radius: 5px; text-align: center; margin-bottom: 20px;"><span style="font-weight: bold; color: white;">🔗 Exchange Connection (API Keys)</span></div>', unsafe_allow_html=True)
+    st.markdown('<div class="section-banner exchange">🔗 Exchange Connection (API Keys)</div>', unsafe_allow_html=True)
     
     with st.expander("🔑 Manage Exchange API Keys", expanded=False):
         with st.form("api_key_form"):
             c_ex, c_ak, c_as = st.columns([1, 2, 2])
             with c_ex:
-                ex_select = st.selectbox("Exchange", ["binance", "coinbase", "kraken", "kucoin", "bybit", "okx"])
+                ex_select = st.selectbox("Exchange", SUPPORTED_EXCHANGES)
             with c_ak:
                 api_key_input = st.text_input("API Key", type="password")
             with c_as:
@@ -2281,7 +2373,7 @@ elif page_nav == "Web3 Integration":
                     if success:
                         st.success(f"✅ API Keys for {ex_select} saved securely.")
                         # Auto-inject if current bot exchange matches
-                        if st.session_state.get('exchange') == ex_select:
+                        if exchange == ex_select:
                              bot = get_bot(ex_select)
                              bot.initialize_credentials(st.session_state.username)
                     else:
@@ -2292,20 +2384,23 @@ elif page_nav == "Web3 Integration":
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Connect Wallet Section
-    st.markdown('<div style="background: linear-gradient(90deg, #00f2ff, #2563eb); padding: 10px; border-radius: 5px; text-align: center; margin-bottom: 20px;"><span style="font-weight: bold; color: white;">📍 Connect Wallet</span></div>', unsafe_allow_html=True)
+    st.markdown('<div class="section-banner wallet">📍 Connect Wallet</div>', unsafe_allow_html=True)
+    
+    # Snapshot wallet once for this render
+    w3 = st.session_state.web3_wallet
     
     # Ensure Tron name is updated (Hot-fix)
-    if st.session_state.web3_wallet.CHAINS.get('tron', {}).get('name') == 'Tron':
-        st.session_state.web3_wallet.CHAINS['tron']['name'] = 'Tron Network (TRC-20)'
+    if w3.CHAINS.get('tron', {}).get('name') == 'Tron':
+        w3.CHAINS['tron']['name'] = 'Tron Network (TRC-20)'
     
-    if st.session_state.web3_wallet.is_connected():
-         chain_info = st.session_state.web3_wallet.CHAINS.get(st.session_state.web3_wallet.chain_id, {})
+    if w3.is_connected():
+         chain_info = w3.CHAINS.get(w3.chain_id, {})
          chain_name = chain_info.get('name', 'Unknown Chain')
-         st.success(f"✅ Connected: {st.session_state.web3_wallet.address} ({chain_name})")
+         st.success(f"✅ Connected: {w3.address} ({chain_name})")
          
          # Show Balance (Cached)
          if 'web3_balance' not in st.session_state:
-             st.session_state.web3_balance = st.session_state.web3_wallet.get_balance()
+             st.session_state.web3_balance = w3.get_balance()
              
          balance = st.session_state.web3_balance
          symbol = chain_info.get('symbol', 'ETH')
@@ -2315,13 +2410,15 @@ elif page_nav == "Web3 Integration":
          # Use new Portfolio Value Logic
          capital_usd = 0.0
          try:
-             capital_usd = st.session_state.web3_wallet.get_portfolio_value_usd()
-         except:
+             capital_usd = get_cached_portfolio_value(w3, w3.address, w3.chain_id)
+         except Exception:
              pass
              
+         # Resolve the bot once for the fallback pricing and capital sync below
+         bot = get_bot(exchange)
+         
          # Fallback estimation if portfolio calc returned 0 but we have native balance
          if capital_usd == 0 and balance > 0:
-             bot = get_bot(st.session_state.get('exchange', 'binance'))
              usd_price = 1.0 
              try:
                  ticker = f"{symbol}/USDT"
@@ -2330,13 +2427,10 @@ elif page_nav == "Web3 Integration":
                      usd_price = live_price
                  else:
                      usd_price = 0.0
-             except:
+             except Exception:
                  usd_price = 0.0
              capital_usd = balance * usd_price
 
-         # Always get bot instance for subsequent sections
-         bot = get_bot(st.session_state.get('exchange', 'binance'))
-         
          if capital_usd > 0:
              bot.risk_manager.update_live_balance(capital_usd)
              st.caption(f"✅ Trading Capital Synced: ${capital_usd:,.2f}")
@@ -2369,27 +2463,29 @@ elif page_nav == "Web3 Integration":
          with st.expander("📥 Crypto Deposit (Web3 Address)", expanded=True):
               st.markdown("### Deposit Address")
               st.markdown("Send funds to this address to top up your bot wallet:")
-              st.code(st.session_state.web3_wallet.address, language="text")
+              st.code(w3.address, language="text")
              
-              c_info = st.session_state.web3_wallet.CHAINS.get(st.session_state.web3_wallet.chain_id, {})
-              net_name = c_info.get('name', 'Unknown Network')
-              sym = c_info.get('symbol', 'ETH')
+              net_name = chain_info.get('name', 'Unknown Network')
+              sym = chain_info.get('symbol', 'ETH')
              
               st.info(f"**Network:** {net_name}\\n\\nEnsure you are sending **{sym}** (or supported tokens) on the **{net_name}** blockchain.")
              
-              if st.session_state.web3_wallet.chain_id == 'ton':
+              if w3.chain_id == 'ton':
                   st.warning("⚠️ For TON: No Memo is required for this non-custodial wallet.")
 
          c_w1, c_w2 = st.columns(2)
          with c_w1:
              if st.button("Refresh Balance", use_container_width=True):
-                 st.session_state.web3_balance = st.session_state.web3_wallet.get_balance()
+                 clear_wallet_caches(w3)
+                 st.session_state.web3_balance = w3.get_balance()
                  st.rerun()
          with c_w2:
              if st.button("Disconnect", use_container_width=True):
-                 st.session_state.web3_wallet.disconnect()
-                 if 'web3_balance' in st.session_state:
-                     del st.session_state.web3_balance
+                 clear_wallet_caches(w3)
+                 w3.disconnect()
+                 # Drop per-wallet session state so it doesn't linger for the session lifetime
+                 for k in ('web3_balance', 'show_ton_modal', 'connect_modal', 'scan_results'):
+                     st.session_state.pop(k, None)
                  st.rerun()
     else:
         # Connection Modal State
@@ -2404,41 +2500,25 @@ elif page_nav == "Web3 Integration":
                 st.write(f"Enter your {target_wallet} details:")
                 
                 # Determine default chain based on wallet
-                default_chain = '1'
-                if 'Phantom' in target_wallet: default_chain = 'solana'
-                elif 'TON' in target_wallet: default_chain = 'ton'
-                elif 'Keplr' in target_wallet: default_chain = 'cosmos'
-                elif 'Trust' in target_wallet: default_chain = '56' # BNB
-                elif 'Bitcoin' in target_wallet: default_chain = 'bitcoin'
-                elif 'Litecoin' in target_wallet: default_chain = 'litecoin'
-                elif 'Dogecoin' in target_wallet: default_chain = 'dogecoin'
-                elif 'Tron' in target_wallet: default_chain = 'tron'
+                default_chain = next((cid for name, cid in WALLET_DEFAULT_CHAINS if name in target_wallet), '1')
                 
                 # Allow chain selection for some
                 if target_wallet in ['MetaMask', 'Coinbase', 'Trust Wallet', 'OKX Wallet', 'WalletConnect', 'Other / Custom']:
                     chain_options = {k: v['name'] for k, v in st.session_state.web3_wallet.CHAINS.items()}
-                    # Sort by name
-                    sorted_chains = sorted(chain_options.items(), key=lambda x: x[1])
-                    selected_chain_id = st.selectbox("Select Network", [x[0] for x in sorted_chains], format_func=lambda x: chain_options[x], index=[x[0] for x in sorted_chains].index(default_chain) if default_chain in [x[0] for x in sorted_chains] else 0)
+                    # Sort by name once; membership check is a dict lookup
+                    chain_ids = sorted(chain_options, key=chain_options.get)
+                    selected_chain_id = st.selectbox("Select Network", chain_ids, format_func=chain_options.get, index=chain_ids.index(default_chain) if default_chain in chain_options else 0)
                 else:
                     selected_chain_id = default_chain
                     st.caption(f"Network: {st.session_state.web3_wallet.CHAINS.get(default_chain, {}).get('name', default_chain)}")
 
                 # Custom UI Component for Private Key Entry (User Requested Style)
-                st.markdown("""
-                <div class="wallet-panel" style="background-color: #111827; padding: 1.5rem; border-radius: 0.5rem; border: 1px solid #374151; margin-bottom: 5px;">
-                   <h3 style="font-size: 1.125rem; font-weight: 700; color: #4ade80; margin: 0 0 10px 0;">🔐 Manual Private Key Entry</h3> 
-                   <p style="font-size: 0.875rem; color: #d1d5db; margin-bottom: 5px;">Enter your private key securely below. It is used locally for signing only.</p>
-                </div>
-                """, unsafe_allow_html=True)
+                wallet_html = get_wallet_form_html()
+                st.markdown(wallet_html['panel'], unsafe_allow_html=True)
 
                 addr_input = st.text_input("Private Key", type="password", label_visibility="collapsed", placeholder="0x... (Private Key)", key="pk_input_field")
                 
-                st.markdown("""
-                <p style="font-size: 0.75rem; color: #ef4444; margin-top: 5px; margin-bottom: 15px;">
-                 ⚠️ Never share your private key. It will only be used locally for signing transactions.
-                </p>
-                """, unsafe_allow_html=True)
+                st.markdown(wallet_html['warning'], unsafe_allow_html=True)
                 
                 c1, c2 = st.columns(2)
                 with c1:
@@ -2458,56 +2538,18 @@ elif page_nav == "Web3 Integration":
                         st.session_state.connect_modal = None
                         st.rerun()
 
-                st.markdown("""
-                <p style="font-size: 0.75rem; color: #f87171; margin-top: 0.5rem;"> 
-                   ⚠️ Never share your private key. It will only be used locally for signing transactions. 
-                </p>
-                """, unsafe_allow_html=True)
+                st.markdown(wallet_html['warning'], unsafe_allow_html=True)
 
         else:
             # Wallet Grid
-            w_col1, w_col2 = st.columns(2)
-            
-            with w_col1:
-                if st.button("🦊 MetaMask", use_container_width=True):
-                    st.session_state.connect_modal = "MetaMask"
-                    st.rerun()
-                if st.button("🔵 Coinbase", use_container_width=True):
-                    st.session_state.connect_modal = "Coinbase"
-                    st.rerun()
-                if st.button("👻 Phantom (SOL)", use_container_width=True):
-                    st.session_state.connect_modal = "Phantom"
-                    st.rerun()
-                if st.button("💎 TON Wallet", use_container_width=True):
-                    st.session_state.connect_modal = "TON Wallet"
-                    st.rerun()
-                if st.button("🔴 TronLink (TRX)", use_container_width=True):
-                    st.session_state.connect_modal = "TronLink (TRX)"
-                    st.rerun()
-                if st.button("🔗 WalletConnect", use_container_width=True):
-                    st.session_state.connect_modal = "WalletConnect"
-                    st.rerun()
+            for w_col, wallets in zip(st.columns(2), WALLET_GRID_COLUMNS):
+                with w_col:
+                    for label, modal in wallets:
+                        st.button(label, use_container_width=True, on_click=set_session_state,
+                                  kwargs={'connect_modal': modal})
                 
-            with w_col2:
-                if st.button("🛡️ Trust Wallet", use_container_width=True):
-                    st.session_state.connect_modal = "Trust Wallet"
-                    st.rerun()
-                if st.button("⚫ OKX Wallet", use_container_width=True):
-                    st.session_state.connect_modal = "OKX Wallet"
-                    st.rerun()
-                if st.button("🪐 Keplr (Cosmos)", use_container_width=True):
-                    st.session_state.connect_modal = "Keplr"
-                    st.rerun()
-                if st.button("🌐 Browser Wallet", use_container_width=True):
-                    st.session_state.connect_modal = "Browser Wallet"
-                    st.rerun()
-                if st.button("🔒 Hardware (Ledger)", use_container_width=True):
-                    st.session_state.connect_modal = "Hardware Wallet"
-                    st.rerun()
-                
-            if st.button("➕ Other / Custom", use_container_width=True):
-                st.session_state.connect_modal = "Other / Custom"
-                st.rerun()
+            st.button("➕ Other / Custom", use_container_width=True, on_click=set_session_state,
+                      kwargs={'connect_modal': "Other / Custom"})
 
 # --- DEFI STAKING MODULE ---
 elif page_nav == "DeFi Staking":
@@ -2538,8 +2580,6 @@ elif page_nav == "DeFi Staking":
                 st.warning("Please enter both token addresses.")
             else:
                 with st.spinner("Compiling & Deploying..."):
-                    # Simulation for UI demo
-                    time.sleep(2)
                     st.info("ℹ️ Real contract deployment requires an active signer and gas. This is a preview.")
                     # st.success("✅ Contract Deployed Successfully!")
                     # st.balloons()
@@ -2559,7 +2599,7 @@ elif page_nav == "DeFi Staking":
         if pool_addr:
             # Connect if needed
             if 'defi_mgr' not in st.session_state:
-                st.session_state.defi_mgr = DeFiManager()
+                st.session_state.defi_mgr = lazy_class('DeFiManager')(ton_manager=get_ton_manager())
                 st.session_state.defi_mgr.connect_to_chain('ethereum') # Default
 
             # Fetch Stats
@@ -2582,7 +2622,7 @@ elif page_nav == "DeFi Staking":
                 if st.button("Stake Tokens"):
                     # Force Reload if method missing
                     if 'defi_mgr' not in st.session_state or not hasattr(st.session_state.defi_mgr, 'stake_in_pool'):
-                        st.session_state.defi_mgr = DeFiManager()
+                        st.session_state.defi_mgr = lazy_class('DeFiManager')(ton_manager=get_ton_manager())
                         st.session_state.defi_mgr.connect_to_chain('ethereum')
                         
                     res = st.session_state.defi_mgr.stake_in_pool(pool_addr, stake_token_addr, float(stake_amt))
@@ -2598,7 +2638,7 @@ elif page_nav == "DeFi Staking":
                 if st.button("Withdraw Stake"):
                      # Force Reload if method missing
                      if 'defi_mgr' not in st.session_state or not hasattr(st.session_state.defi_mgr, 'withdraw_from_pool'):
-                         st.session_state.defi_mgr = DeFiManager()
+                         st.session_state.defi_mgr = lazy_class('DeFiManager')(ton_manager=get_ton_manager())
                          st.session_state.defi_mgr.connect_to_chain('ethereum')
                          
                      res = st.session_state.defi_mgr.withdraw_from_pool(pool_addr, float(withdraw_amt), stake_token_addr2)
@@ -2612,7 +2652,7 @@ elif page_nav == "DeFi Staking":
                 if st.button("Claim Rewards", type="primary"):
                     # Force Reload if method missing
                     if 'defi_mgr' not in st.session_state or not hasattr(st.session_state.defi_mgr, 'claim_rewards'):
-                        st.session_state.defi_mgr = DeFiManager()
+                        st.session_state.defi_mgr = lazy_class('DeFiManager')(ton_manager=get_ton_manager())
                         st.session_state.defi_mgr.connect_to_chain('ethereum')
                         
                     try:
@@ -2642,8 +2682,9 @@ elif page_nav == "Fiat Gateway (NGN)":
         st.metric("NGN Balance", f"₦{fiat_mgr.fiat_balance:,.2f}")
     with col_prov2:
         current_prov = fiat_mgr.provider
-        # Enforce Flutterwave only
-        selected_prov = st.selectbox("Active Provider", ["flutterwave"], index=0, key="active_prov_sel", disabled=True)
+        # Enforce Flutterwave only (read-only indicator, no widget state needed)
+        selected_prov = "flutterwave"
+        st.metric("Active Provider", selected_prov.title())
         
         if selected_prov != current_prov and selected_prov == 'flutterwave':
             username = st.session_state.get('username')
@@ -2770,9 +2811,7 @@ elif page_nav == "Fiat Gateway (NGN)":
                         st.rerun()
                 
                 with col_m2:
-                    if st.button("Cancel / Clear"):
-                        del st.session_state['wd_error_state']
-                        st.rerun()
+                    st.button("Cancel / Clear", on_click=st.session_state.pop, args=('wd_error_state', None))
                 
                 st.divider() # Separator
             else:
@@ -2837,17 +2876,14 @@ elif page_nav == "Fiat Gateway (NGN)":
                         
                         if res['status'] == 'success':
                             # Credit USDT (Real Wallet Only - No Mock)
-                            st.success(f"Swapped ₦{ngn_in:,.2f} for {res['amount_out']:.2f} USDT!")
-                            st.info("USDT credited to your Exchange Wallet.")
+                            # Toasts survive the rerun below, so no sleep is needed to show them
+                            st.toast(f"Swapped ₦{ngn_in:,.2f} for {res['amount_out']:.2f} USDT! Credited to your Exchange Wallet.", icon="✅")
                             
                             # Update Real Balance (Bot's Live Trading Balance)
                             if hasattr(bot, 'risk_manager'):
-                                current_bal = bot.risk_manager.live_balance
-                                new_bal = current_bal + res['amount_out']
-                                bot.risk_manager.update_live_balance(new_bal)
-                                st.success(f"Live Trading Balance Updated: ${new_bal:,.2f}")
+                                new_bal = bot.risk_manager.adjust_live_balance(res['amount_out'])
+                                st.toast(f"Live Trading Balance Updated: ${new_bal:,.2f}")
                             
-                            time.sleep(1)
                             st.rerun()
                         else:
                             st.error(f"Swap Failed: {res.get('message')}")
@@ -2873,8 +2909,7 @@ elif page_nav == "Fiat Gateway (NGN)":
                          res = fiat_mgr.execute_swap('USDT', 'NGN', usdt_in)
                          
                          if res['status'] == 'success':
-                             st.success(f"Swapped {usdt_in:.2f} USDT for ₦{res['amount_out']:,.2f}!")
-                             time.sleep(1)
+                             st.toast(f"Swapped {usdt_in:.2f} USDT for ₦{res['amount_out']:,.2f}!", icon="✅")
                              st.rerun()
                          else:
                              st.error(f"Swap Failed: {res.get('message')}")
@@ -2896,8 +2931,7 @@ elif page_nav == "Fiat Gateway (NGN)":
                 with st.spinner("Processing refund..."):
                     res = fiat_mgr.refund_usdt_credit_to_ngn(refund_amt)
                     if res.get('status') == 'success':
-                        st.success(f"Refunded {res['amount_usd']:.2f} USDT -> ₦{res['ngn_amount']:,.2f}")
-                        time.sleep(1)
+                        st.toast(f"Refunded {res['amount_usd']:.2f} USDT -> ₦{res['ngn_amount']:,.2f}", icon="✅")
                         st.rerun()
                     else:
                         st.error(f"Refund Failed: {res.get('message')}")
@@ -2932,37 +2966,39 @@ elif page_nav in ["Arbitrage Scanner", "Copy Trading", "DeFi Bridge", "Quantum L
                 st.session_state.arb_last = time.time()
                 st.rerun()
         
-        holder = st.empty()
-        prices_df = scanner.get_prices_df(symbol_sel)
-        if not prices_df.empty:
-            holder.dataframe(prices_df, use_container_width=True)
-            
-        opps = scanner.scan_opportunities(symbol_sel)
-        if opps:
-            st.markdown("### Top Opportunities")
-            st.table(pd.DataFrame(opps))
-        else:
-            st.info("No arbitrage opportunities found currently.")
-            
-        if st.session_state.get('arb_live'):
-            time.sleep(5)
-            st.rerun()
+        # Live mode re-runs only this fragment on a timer instead of sleeping the script thread
+        @st.fragment(run_every=5 if start_live else None)
+        def render_arbitrage_scan():
+            holder = st.empty()
+            # One price snapshot feeds both the table and the scan (each exchange is queried once)
+            arb_prices = scanner.fetch_prices(symbol_sel)
+            prices_df = scanner.get_prices_df(symbol_sel, arb_prices)
+            if not prices_df.empty:
+                holder.dataframe(prices_df, use_container_width=True)
+                
+            opps = scanner.scan_opportunities(symbol_sel, arb_prices)
+            if opps:
+                st.markdown("### Top Opportunities")
+                st.table(pd.DataFrame(opps))
+            else:
+                st.info("No arbitrage opportunities found currently.")
+
+        render_arbitrage_scan()
     elif page_nav == "Copy Trading":
         # Initialize bot for session access (Required for Copy Trading execution)
         bot = get_bot(exchange)
         st.session_state.bot = bot
         
         if 'copy_mod' not in st.session_state:
-            from core.copy_trading import CopyTradingModule
-            st.session_state.copy_mod = CopyTradingModule()
+            st.session_state.copy_mod = lazy_class('CopyTradingModule')()
         st.session_state.copy_mod.render_ui()
     elif page_nav == "DeFi Bridge":
         # Force reload if method missing (Fix for AttributeError during hot-reload)
         if 'defi_mgr' not in st.session_state or not hasattr(st.session_state.defi_mgr, 'bridge_assets'):
-            st.session_state.defi_mgr = DeFiManager()
+            st.session_state.defi_mgr = lazy_class('DeFiManager')(ton_manager=get_ton_manager())
             st.session_state.defi_mgr.connect_to_chain(st.session_state.get('evm_chain', 'ethereum'))
             
-        chains = list(DeFiManager.CHAINS.keys())
+        chains = list(lazy_class('DeFiManager').CHAINS.keys())
         src = st.selectbox("Source Chain", chains, index=chains.index(st.session_state.defi_mgr.current_chain) if st.session_state.defi_mgr.current_chain in chains else 0)
         tgt = st.selectbox("Target Chain", chains, index=chains.index('bsc') if 'bsc' in chains else 0)
         amt = st.number_input("Amount", min_value=0.0, value=10.0)
@@ -2976,20 +3012,20 @@ elif page_nav in ["Arbitrage Scanner", "Copy Trading", "DeFi Bridge", "Quantum L
             st.session_state.quantum_engine = QuantumEngine()
         qe = st.session_state.quantum_engine
         bot = get_bot(exchange)
-        df = get_cached_ohlcv(bot, st.session_state.get('symbol','BTC/USDT'), st.session_state.get('timeframe','1h'))
-        regime = qe.detect_regime_quantum(df) if isinstance(df, pd.DataFrame) else "Normal"
-        st.metric("Regime", regime)
-        if isinstance(df, pd.DataFrame) and not df.empty:
-            last_price = df['close'].iloc[-1]
-            vol = df['close'].pct_change().std() if len(df) > 30 else 0.02
-            x, pdf = qe.calculate_probability_wave(last_price, float(vol), time_horizon=10)
-            chart_df = pd.DataFrame({"price": x, "prob": pdf})
-            st.line_chart(chart_df.set_index("price"))
         live_q = st.toggle("Live Mode", value=st.session_state.get('quantum_live', False))
         st.session_state.quantum_live = live_q
-        if live_q:
-            time.sleep(10)
-            st.rerun()
+
+        # Live mode re-runs only this fragment on a timer instead of sleeping the script thread
+        @st.fragment(run_every=10 if live_q else None)
+        def render_quantum_wave():
+            df, last_price, vol = get_cached_ohlcv_stats(bot, st.session_state.get('symbol','BTC/USDT'), st.session_state.get('timeframe','1h'))
+            regime = qe.detect_regime_quantum(df) if isinstance(df, pd.DataFrame) else "Normal"
+            st.metric("Regime", regime)
+            if last_price is not None:
+                chart_df = get_cached_probability_wave(qe, round(last_price, 2), round(vol, 4), time_horizon=10)
+                st.line_chart(chart_df)
+
+        render_quantum_wave()
     elif page_nav == "Risk Manager":
         bot = get_bot(exchange)
         rm = bot.risk_manager
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from core.arbitrage import ArbitrageScanner
+
+PRICES = {'binance': 100.0, 'kraken': 102.0, 'kucoin': 99.5, 'okx': 101.0}
+
+
+class TestArbitrageScanner(unittest.TestCase):
+    def setUp(self):
+        # Every monitored exchange resolves to a mocked ccxt client; only the
+        # venues in PRICES quote, the rest fail like an unreachable API
+        self.mock_ccxt = MagicMock()
+        self.clients = {}
+
+        def make_exchange(name):
+            client = MagicMock()
+            if name in PRICES:
+                client.fetch_ticker.return_value = {'last': PRICES[name]}
+            else:
+                client.fetch_ticker.side_effect = Exception("network down")
+            self.clients[name] = client
+            return MagicMock(return_value=client)
+
+        self.patcher = patch('core.arbitrage.ccxt', self.mock_ccxt)
+        self.patcher.start()
+        for name in ArbitrageScanner().monitored_exchanges:
+            setattr(self.mock_ccxt, name, make_exchange(name))
+        self.scanner = ArbitrageScanner()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_scan_fetches_and_picks_cheapest_and_dearest_venue(self):
+        opps = self.scanner.scan_opportunities('BTC/USDT')
+        self.assertEqual(len(opps), 1)
+        opp = opps[0]
+        self.assertEqual(opp['buy_exchange'], 'kucoin')
+        self.assertEqual(opp['sell_exchange'], 'kraken')
+        self.assertEqual(opp['buy_price'], 99.5)
+        self.assertEqual(opp['sell_price'], 102.0)
+        self.assertAlmostEqual(opp['spread_pct'], 2.5 / 99.5 * 100)
+        self.assertAlmostEqual(opp['estimated_profit_1k'], 1000 * 2.5 / 99.5)
+        self.assertEqual(opp['quantum_rank'], 'Top Pick')
+        self.clients['binance'].fetch_ticker.assert_called_once_with('BTC/USDT')
+
+    def test_snapshot_is_reused_without_refetching(self):
+        prices = self.scanner.fetch_prices('BTC/USDT')
+        self.assertEqual(prices, PRICES)
+        self.scanner.scan_opportunities('BTC/USDT', prices=prices)
+        self.scanner.get_prices_df('BTC/USDT', prices=prices)
+        for client in self.clients.values():
+            self.assertEqual(client.fetch_ticker.call_count, 1)
+
+    def test_scan_ignores_spread_below_threshold(self):
+        self.assertEqual(self.scanner.scan_opportunities('BTC/USDT', prices={'binance': 100.0, 'okx': 100.05}), [])
+
+    def test_scan_needs_two_venues(self):
+        self.assertEqual(self.scanner.scan_opportunities('BTC/USDT', prices={'binance': 100.0}), [])
+        self.assertEqual(self.scanner.scan_opportunities('BTC/USDT', prices={}), [])
+
+    def test_prices_df_sorted_by_price_with_spread(self):
+        df = self.scanner.get_prices_df('BTC/USDT')
+        self.assertEqual(list(df['Exchange']), ['KRAKEN', 'OKX', 'BINANCE', 'KUCOIN'])
+        self.assertEqual(list(df['Price']), [102.0, 101.0, 100.0, 99.5])
+        self.assertTrue((df['Symbol'] == 'BTC/USDT').all())
+        expected = [(p - 99.5) / 99.5 * 100 for p in (102.0, 101.0, 100.0, 99.5)]
+        for got, want in zip(df['Spread (%)'], expected):
+            self.assertAlmostEqual(got, want)
+
+    def test_prices_df_single_and_no_venue(self):
+        df = self.scanner.get_prices_df('ETH/USDT', prices={'binance': 3500.0})
+        self.assertEqual(list(df['Exchange']), ['BINANCE'])
+        self.assertEqual(list(df['Spread (%)']), [0.0])
+        self.assertTrue(self.scanner.get_prices_df('ETH/USDT', prices={}).empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
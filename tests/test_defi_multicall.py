@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from core.defi import DeFiManager
+
+PRIVATE_KEY = "0x" + "01" * 32
+TOKEN_A = "0x" + "aa" * 20
+TOKEN_B = "0x" + "bb" * 20
+
+
+def word(n):
+    return n.to_bytes(32, 'big')
+
+
+def make_nc(results=None, error=None):
+    nc = MagicMock()
+    nc.w3.to_checksum_address.side_effect = lambda a: a
+    aggregate3 = nc.w3.eth.contract.return_value.functions.aggregate3
+    if error:
+        aggregate3.return_value.call.side_effect = error
+    else:
+        aggregate3.return_value.call.return_value = results
+    return nc, aggregate3
+
+
+class TestErc20Balances(unittest.TestCase):
+    def setUp(self):
+        # Keep the constructor off the network: no RPC provider, no DEX clients
+        patchers = [
+            patch('core.defi.Web3', MagicMock()),
+            patch('core.defi.DEX_INTEGRATION_AVAILABLE', False),
+        ]
+        for p in patchers:
+            p.start()
+            self.addCleanup(p.stop)
+        self.mgr = DeFiManager(ton_manager=MagicMock())
+        self.owner = self.mgr.load_private_key(PRIVATE_KEY)
+
+    def test_decodes_successful_results(self):
+        nc, aggregate3 = make_nc([
+            (True, word(1_500_000)), (True, word(6)),       # 1.5 USDC-style
+            (True, word(2 * 10 ** 18)), (True, word(18)),   # 2.0
+        ])
+        self.assertEqual(self.mgr.erc20_balances(nc, [TOKEN_A, TOKEN_B]), [1.5, 2.0])
+
+        calls = aggregate3.call_args[0][0]
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(calls[0], (TOKEN_A, True, DeFiManager.BALANCE_OF_SELECTOR + bytes.fromhex(self.owner[2:]).rjust(32, b'\0')))
+        self.assertEqual(calls[1], (TOKEN_A, True, DeFiManager.DECIMALS_SELECTOR))
+        nc.w3.eth.contract.assert_called_once_with(address=DeFiManager.MULTICALL3_ADDRESS, abi=DeFiManager.MULTICALL3_ABI)
+
+    def test_failed_entries_read_as_none(self):
+        nc, _ = make_nc([
+            (False, b''), (True, word(18)),               # balanceOf reverted
+            (True, word(5 * 10 ** 6)), (True, b'\x00'),  # short decimals payload
+        ])
+        self.assertEqual(self.mgr.erc20_balances(nc, [TOKEN_A, TOKEN_B]), [None, None])
+
+    def test_falls_back_when_multicall_fails(self):
+        nc, _ = make_nc(error=ValueError("no multicall on this chain"))
+        with patch.object(DeFiManager, 'erc20_balance', side_effect=[3.0, 4.0]) as single:
+            self.assertEqual(self.mgr.erc20_balances(nc, [TOKEN_A, TOKEN_B]), [3.0, 4.0])
+        self.assertEqual(single.call_count, 2)
+
+    def test_non_evm_uses_per_token_path(self):
+        self.mgr.connect_to_chain('ton')
+        nc = MagicMock()
+        with patch.object(DeFiManager, 'erc20_balance', return_value=7.0):
+            self.assertEqual(self.mgr.erc20_balances(nc, [TOKEN_A]), [7.0])
+        nc.w3.eth.contract.assert_not_called()
+
+    def test_no_address_or_tokens(self):
+        nc = MagicMock()
+        self.assertEqual(self.mgr.erc20_balances(nc, []), [])
+        self.mgr.clear_private_key()
+        self.assertEqual(self.mgr.erc20_balances(nc, [TOKEN_A, TOKEN_B]), [0.0, 0.0])
+        nc.w3.eth.contract.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
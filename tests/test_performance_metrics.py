@@ -0,0 +1,116 @@
+import math
+import os
+import shutil
+import tempfile
+import unittest
+
+from core.auth import UserManager
+
+EMPTY = {
+    "total_pnl": 0.0,
+    "win_rate": 0.0,
+    "total_trades": 0,
+    "profit_factor": 0.0,
+    "sharpe_ratio": 0.0,
+    "max_drawdown": 0.0
+}
+
+
+def reference_metrics(history):
+    """The per-trade loop _compute_performance_metrics replaced, kept as the parity oracle"""
+    closed = [t['pnl'] for t in history if t['side'].lower() == 'sell']
+    if not closed:
+        return dict(EMPTY)
+    wins = [p for p in closed if p > 0]
+    losses = [p for p in closed if p <= 0]
+    gross_loss = abs(sum(losses))
+    sharpe = 0.0
+    if len(closed) > 1:
+        mean = sum(closed) / len(closed)
+        std = math.sqrt(sum((p - mean) ** 2 for p in closed) / len(closed))
+        sharpe = mean / std if std > 0 else 0.0
+    peak, cumulative, max_dd = float('-inf'), 0.0, 0.0
+    for p in closed:
+        cumulative += p
+        peak = max(peak, cumulative)
+        max_dd = max(max_dd, peak - cumulative)
+    return {
+        "total_pnl": sum(closed),
+        "win_rate": len(wins) / len(closed) * 100,
+        "total_trades": len(closed),
+        "profit_factor": sum(wins) / gross_loss if gross_loss > 0 else 999.0,
+        "sharpe_ratio": sharpe,
+        "max_drawdown": max_dd
+    }
+
+
+def trade(side, pnl):
+    return {"side": side, "pnl": pnl}
+
+
+class TestPerformanceMetricsParity(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.data_dir, "trader"))
+        self.manager = UserManager("trader", data_dir=self.data_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def metrics_for(self, history):
+        for record in history:
+            self.manager.log_trade(record)
+        return self.manager.get_performance_metrics()
+
+    def assertParity(self, history):
+        got = self.metrics_for(history)
+        want = reference_metrics(history)
+        self.assertEqual(set(got), set(want))
+        self.assertEqual(got["total_trades"], want["total_trades"])
+        for key in ("total_pnl", "win_rate", "profit_factor", "sharpe_ratio", "max_drawdown"):
+            self.assertAlmostEqual(got[key], want[key], places=9, msg=key)
+        return got
+
+    def test_mixed_history(self):
+        history = [
+            trade("buy", 0.0), trade("SELL", 120.5), trade("buy", 0.0), trade("sell", -40.0),
+            trade("sell", 0.0), trade("sell", 75.25), trade("sell", -200.0), trade("sell", 30.0),
+        ]
+        got = self.assertParity(history)
+        self.assertEqual(got["total_trades"], 6)
+        self.assertAlmostEqual(got["win_rate"], 50.0)
+        self.assertAlmostEqual(got["total_pnl"], -14.25)
+        self.assertAlmostEqual(got["max_drawdown"], 200.0)
+
+    def test_empty_history(self):
+        self.assertEqual(self.manager.get_performance_metrics(), EMPTY)
+
+    def test_only_open_trades(self):
+        self.assertEqual(self.metrics_for([trade("buy", 0.0)] * 3), EMPTY)
+
+    def test_all_losses(self):
+        got = self.assertParity([trade("sell", -10.0), trade("sell", -5.0), trade("sell", -20.0)])
+        self.assertEqual(got["win_rate"], 0.0)
+        self.assertEqual(got["profit_factor"], 0.0)
+        self.assertAlmostEqual(got["max_drawdown"], 25.0)
+
+    def test_all_wins(self):
+        got = self.assertParity([trade("sell", 10.0), trade("sell", 5.0)])
+        self.assertEqual(got["profit_factor"], 999.0)
+        self.assertEqual(got["max_drawdown"], 0.0)
+
+    def test_single_trade(self):
+        got = self.assertParity([trade("sell", 42.0)])
+        self.assertEqual(got["sharpe_ratio"], 0.0)
+
+    def test_new_trade_refreshes_cached_metrics(self):
+        self.assertEqual(self.metrics_for([trade("sell", 10.0)])["total_trades"], 1)
+        self.manager.execute_trade("BTC/USDT", "buy", 1.0, 100.0)
+        self.manager.execute_trade("BTC/USDT", "sell", 1.0, 90.0)
+        got = self.manager.get_performance_metrics()
+        self.assertEqual(got["total_trades"], 2)
+        self.assertAlmostEqual(got["total_pnl"], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
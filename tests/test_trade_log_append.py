@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from core.bot import TradingBot
+
+
+class TestAppendTradeLog(unittest.TestCase):
+    def setUp(self):
+        # The bot keeps its trade/position files relative to the working directory
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.tmpdir.name)
+
+        # Mock out the DB, key store, exchange and wallet the constructor builds
+        mocks = {}
+        for name in ('StorageManager', 'AuthManager', 'DataManager', 'Web3Wallet'):
+            patcher = patch(f'core.bot.{name}')
+            self.addCleanup(patcher.stop)
+            mocks[name] = patcher.start()
+        # Balance migration already applied
+        mocks['StorageManager'].return_value.get_setting.return_value = "true"
+        self.bot = TradingBot('binance')
+        self.path = os.path.join(self.tmpdir.name, self.bot.trade_log_file)
+
+    def write(self, text):
+        with open(self.path, "w") as f:
+            f.write(text)
+
+    def read(self):
+        with open(self.path, "r") as f:
+            return f.read()
+
+    def test_missing_file_falls_back(self):
+        self.assertFalse(self.bot._append_trade_log({"a": 1}))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_empty_file_falls_back_untouched(self):
+        self.write("")
+        self.assertFalse(self.bot._append_trade_log({"a": 1}))
+        self.assertEqual(self.read(), "")
+
+    def test_empty_array(self):
+        self.write("[]")
+        self.assertTrue(self.bot._append_trade_log({"a": 1}))
+        self.assertEqual(self.read(), json.dumps([{"a": 1}], indent=4))
+
+    def test_existing_array_matches_json_dump_layout(self):
+        logs = [{"symbol": "ETH/USDT", "entry": 2250.5, "components": {"rsi": 30}}]
+        with open(self.path, "w") as f:
+            json.dump(logs, f, indent=4)
+        record = {"symbol": "BTC/USDT", "entry": 42000.0, "components": {}}
+        self.assertTrue(self.bot._append_trade_log(record))
+        self.assertEqual(self.read(), json.dumps(logs + [record], indent=4))
+
+    def test_malformed_tail_falls_back_untouched(self):
+        for text in ('[{"a": 1}', '[{"a": 1},\n]', '{"a": 1}'):
+            self.write(text)
+            self.assertFalse(self.bot._append_trade_log({"b": 2}))
+            self.assertEqual(self.read(), text)
+
+    def test_log_trade_resets_corrupted_log(self):
+        self.write('[{"a": 1}')
+        self.bot.log_trade({"bias": "LONG", "strategy": "Smart Trend"})
+        with open(self.path) as f:
+            logs = json.load(f)
+        self.assertEqual(len(logs), 1)
+        self.assertEqual(logs[0]["type"], "LONG")
+
+    def test_round_trip_after_several_appends(self):
+        self.write("[]")
+        records = [{"i": i, "price": 100.0 + i, "note": "line\n\"quoted\" é"} for i in range(25)]
+        for record in records:
+            self.assertTrue(self.bot._append_trade_log(record))
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), records)
+        self.assertEqual(self.read(), json.dumps(records, indent=4))
+
+
+if __name__ == '__main__':
+    unittest.main()